@@ -14,7 +14,7 @@ import sys
 import struct
 import threading
 import time
-from collections import deque
+from collections import deque, namedtuple
 
 # PyQt5
 from PyQt5.QtWidgets import (
@@ -38,6 +38,14 @@ import serial.tools.list_ports
 
 import numpy as np
 
+# Numba is optional: when present the header-scan + checksum loop is
+# LLVM-compiled; otherwise the plain-Python scan is used.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # ===================== PROTOCOL CONSTANTS =====================
 HEADER_1 = 0xAA
@@ -45,11 +53,92 @@ HEADER_2 = 0x55
 FRAME_SIZE = 73
 BAUD_RATE = 115200
 
+# Reciprocals of the wire scale factors: multiply instead of divide on
+# the decode hot path.
+_S10 = 0.1
+_S100 = 0.01
+_S1E7 = 1e-7
+
+# Complete frame payload (everything between the 3-byte header and the
+# checksum byte), compiled once so _parse_frame does a single unpack call
+# instead of ~20 per-field struct.unpack calls.
+_FRAME_STRUCT = struct.Struct('<IhhhhhhHhiiiHHBB4h4hB4hBBHh')
+assert _FRAME_STRUCT.size == FRAME_SIZE - 4  # header (3) + checksum (1)
+
+# Structured view of a whole 73-byte frame so a run of validated frames can
+# be decoded in a single numpy pass instead of frame-at-a-time struct calls.
+FRAME_DTYPE = np.dtype([
+    ('h1', 'u1'), ('h2', 'u1'), ('len', 'u1'),
+    ('timestamp', '<u4'),
+    ('roll', '<i2'), ('pitch', '<i2'), ('yaw', '<i2'),
+    ('accel_x', '<i2'), ('accel_y', '<i2'), ('accel_z', '<i2'),
+    ('pressure', '<u2'), ('baro_alt', '<i2'),
+    ('lat', '<i4'), ('lon', '<i4'), ('gps_alt', '<i4'),
+    ('speed', '<u2'), ('heading', '<u2'),
+    ('sats', 'u1'), ('fix', 'u1'),
+    ('servo_cmds', '<i2', (4,)), ('servo_fb', '<i2', (4,)),
+    ('servo_status', 'u1'),
+    ('track', '<i2', (4,)),
+    ('battery', 'u1'), ('charging', 'u1'), ('voltage', '<u2'),
+    ('temperature', '<i2'),
+    ('checksum', 'u1'),
+])
+assert FRAME_DTYPE.itemsize == FRAME_SIZE
+
+# Decoded (scaled) records; field names match the dict keys the GUI uses,
+# so records can be subscripted exactly like the old per-frame dicts.
+PARSED_DTYPE = np.dtype([
+    ('timestamp', '<u4'),
+    ('roll', '<f4'), ('pitch', '<f4'), ('yaw', '<f4'),
+    ('accel_x', '<f4'), ('accel_y', '<f4'), ('accel_z', '<f4'),
+    ('pressure', '<u2'), ('baro_alt', '<f4'),
+    ('lat', '<f8'), ('lon', '<f8'), ('gps_alt', '<f4'),
+    ('speed', '<f4'), ('heading', '<f4'),
+    ('sats', 'u1'), ('fix', 'u1'),
+    ('servo_cmds', '<i2', (4,)), ('servo_fb', '<i2', (4,)),
+    ('servo_status', 'u1'),
+    ('track_x', '<i2'), ('track_y', '<i2'), ('track_w', '<i2'), ('track_h', '<i2'),
+    ('battery', 'u1'), ('charging', 'u1'), ('voltage', '<u2'),
+    ('temperature', '<f4'),
+])
+
+# Scalar frame for the one-off fallback decode path: fixed slots, no
+# per-frame dict allocation. Field order matches PARSED_DTYPE.
+TelemetryFrame = namedtuple('TelemetryFrame', [n for n, *_ in PARSED_DTYPE.descr])
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _scan_frames(buf, out):
+        """Find validated frame starts in buf; write them into out.
+
+        Returns (frames_found, checksum_errors, resume_offset) where
+        resume_offset is the first index that may still hold a partial frame.
+        """
+        i = 0
+        k = 0
+        errors = 0
+        n = buf.shape[0]
+        while i + 73 <= n:
+            if buf[i] != 0xAA or buf[i + 1] != 0x55:
+                i += 1
+                continue
+            c = 0
+            for j in range(72):
+                c ^= buf[i + j]
+            if c == buf[i + 72]:
+                out[k] = i
+                k += 1
+                i += 73
+            else:
+                errors += 1
+                i += 1
+        return k, errors, i
+
 
 # ===================== SIGNAL BRIDGE =====================
 class SignalBridge(QObject):
     """Bridge for thread-safe GUI updates"""
-    new_frame = pyqtSignal(dict)
     raw_data = pyqtSignal(bytes)
     status_update = pyqtSignal(str)
 
@@ -57,127 +146,204 @@ class SignalBridge(QObject):
 # ===================== FRAME PARSER =====================
 class FrameParser:
     """Parse 73-byte telemetry frames"""
-    
+
+    # Fixed receive buffer capacity. Incoming bytes append at _tail and are
+    # consumed by advancing _head, so there is no per-frame tail copy; the
+    # buffer is compacted only when the free space at the end runs out.
+    BUF_CAP = 1 << 16
+
     def __init__(self):
-        self.buffer = bytearray()
+        self._buf = bytearray(self.BUF_CAP)
+        self._mv = memoryview(self._buf)
+        self._head = 0
+        self._tail = 0
         self.frame_count = 0
         self.error_count = 0
-    
-    def parse(self, data: bytes) -> list:
-        """Add data to buffer and extract complete frames"""
-        self.buffer.extend(data)
-        frames = []
-        
-        while len(self.buffer) >= FRAME_SIZE:
+        if NUMBA_AVAILABLE:
+            # Warm up the JIT here so first-compile latency is paid at
+            # startup, not on the first live frame.
+            _scan_frames(np.zeros(FRAME_SIZE, dtype=np.uint8),
+                         np.zeros(1, dtype=np.int32))
+
+    def parse(self, data: bytes):
+        """Add data to buffer and extract complete frames.
+
+        Returns a structured array (PARSED_DTYPE) of all validated frames,
+        decoded in one vectorized pass.
+        """
+        self._append(data)
+        if NUMBA_AVAILABLE:
+            valid = self._scan_jit()
+        else:
+            valid = self._scan_python()
+        return self.parse_batch(bytes(valid))
+
+    def _append(self, data: bytes):
+        """Copy new bytes in at _tail, compacting the pending span first
+        if it would overflow the fixed buffer"""
+        n = len(data)
+        if self._tail + n > self.BUF_CAP:
+            pending = self._tail - self._head
+            if pending:
+                self._mv[:pending] = self._mv[self._head:self._tail]
+            self._head = 0
+            self._tail = pending
+            if self._tail + n > self.BUF_CAP:
+                # Pathological backlog: drop the oldest data and keep what fits
+                keep = self.BUF_CAP - n if n < self.BUF_CAP else 0
+                self._mv[:keep] = self._mv[self._tail - keep:self._tail]
+                self._tail = keep
+                data = data[-(self.BUF_CAP - keep):]
+                n = len(data)
+        self._mv[self._tail:self._tail + n] = data
+        self._tail += n
+
+    def _scan_jit(self) -> bytearray:
+        """Locate validated frames with the compiled scanner"""
+        buf = np.frombuffer(self._mv[self._head:self._tail], dtype=np.uint8)
+        out = np.empty(len(buf) // FRAME_SIZE + 1, dtype=np.int32)
+        k, errors, pos = _scan_frames(buf, out)
+
+        valid = bytearray()
+        head = self._head
+        for n in range(k):
+            start = head + out[n]
+            valid += self._mv[start:start + FRAME_SIZE]
+
+        self.frame_count += k
+        self.error_count += errors
+        self._head = head + pos
+        return valid
+
+    def _scan_python(self) -> bytearray:
+        """Locate validated frames with the interpreter fallback scan"""
+        valid = bytearray()
+        mv = self._mv
+        head, tail = self._head, self._tail
+
+        while tail - head >= FRAME_SIZE:
             # Find header
-            try:
-                idx = self.buffer.index(HEADER_1)
-                if idx > 0:
-                    self.buffer = self.buffer[idx:]
-                
-                if len(self.buffer) < FRAME_SIZE:
+            if mv[head] != HEADER_1:
+                try:
+                    head = self._buf.index(HEADER_1, head, tail)
+                except ValueError:
+                    head = tail
                     break
-                
-                if self.buffer[1] != HEADER_2:
-                    self.buffer = self.buffer[1:]
-                    continue
-                
-                # Extract frame
-                frame_data = bytes(self.buffer[:FRAME_SIZE])
-                self.buffer = self.buffer[FRAME_SIZE:]
-                
-                # Verify checksum
-                calc_checksum = 0
-                for b in frame_data[:-1]:
-                    calc_checksum ^= b
-                
-                if calc_checksum == frame_data[-1]:
-                    parsed = self._parse_frame(frame_data)
-                    if parsed:
-                        frames.append(parsed)
-                        self.frame_count += 1
-                else:
-                    self.error_count += 1
-                    
-            except ValueError:
-                self.buffer.clear()
-                break
-        
-        return frames
-    
-    def _parse_frame(self, data: bytes) -> dict:
-        """Parse a single frame into a dictionary"""
+                if tail - head < FRAME_SIZE:
+                    break
+
+            if mv[head + 1] != HEADER_2:
+                head += 1
+                continue
+
+            frame_data = mv[head:head + FRAME_SIZE]
+
+            # Verify checksum (XOR over all bytes before the checksum,
+            # reduced in C by numpy instead of a per-byte Python loop)
+            calc_checksum = int(np.bitwise_xor.reduce(
+                np.frombuffer(frame_data, dtype=np.uint8, count=FRAME_SIZE - 1)))
+
+            if calc_checksum == frame_data[FRAME_SIZE - 1]:
+                valid += frame_data
+                self.frame_count += 1
+                head += FRAME_SIZE
+            else:
+                self.error_count += 1
+                head += 1
+
+        self._head = head
+        return valid
+
+    def parse_batch(self, data: bytes):
+        """Decode N validated 73-byte frames in a single numpy pass"""
+        raw = np.frombuffer(data, dtype=FRAME_DTYPE)
+        out = np.empty(len(raw), dtype=PARSED_DTYPE)
+
+        out['timestamp'] = raw['timestamp']
+        out['roll'] = raw['roll'] * _S10
+        out['pitch'] = raw['pitch'] * _S10
+        out['yaw'] = raw['yaw'] * _S10
+        out['accel_x'] = raw['accel_x'] * _S100
+        out['accel_y'] = raw['accel_y'] * _S100
+        out['accel_z'] = raw['accel_z'] * _S100
+        out['pressure'] = raw['pressure']
+        out['baro_alt'] = raw['baro_alt'] * _S10
+        out['lat'] = raw['lat'] * _S1E7
+        out['lon'] = raw['lon'] * _S1E7
+        out['gps_alt'] = raw['gps_alt'] * _S100
+        out['speed'] = raw['speed'] * _S10
+        out['heading'] = raw['heading'] * _S10
+        out['sats'] = raw['sats']
+        out['fix'] = raw['fix']
+        out['servo_cmds'] = raw['servo_cmds']
+        out['servo_fb'] = raw['servo_fb']
+        out['servo_status'] = raw['servo_status']
+        out['track_x'] = raw['track'][:, 0]
+        out['track_y'] = raw['track'][:, 1]
+        out['track_w'] = raw['track'][:, 2]
+        out['track_h'] = raw['track'][:, 3]
+        out['battery'] = raw['battery']
+        out['charging'] = raw['charging']
+        out['voltage'] = raw['voltage']
+        out['temperature'] = raw['temperature'] * _S10
+
+        return out
+
+    def _parse_frame(self, data: bytes) -> TelemetryFrame:
+        """Parse a single frame into a TelemetryFrame (scalar fallback for
+        one-off revalidation; the hot path is parse_batch)"""
         try:
-            offset = 3  # Skip header and length
-            
-            # Timestamp (4 bytes, uint32)
-            timestamp = struct.unpack('<I', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Orientation (6 bytes: 3x int16, scaled by 10)
-            roll = struct.unpack('<h', data[offset:offset+2])[0] / 10.0
-            pitch = struct.unpack('<h', data[offset+2:offset+4])[0] / 10.0
-            yaw = struct.unpack('<h', data[offset+4:offset+6])[0] / 10.0
-            offset += 6
-            
-            # Accelerometer (6 bytes: 3x int16, scaled by 100)
-            accel_x = struct.unpack('<h', data[offset:offset+2])[0] / 100.0
-            accel_y = struct.unpack('<h', data[offset+2:offset+4])[0] / 100.0
-            accel_z = struct.unpack('<h', data[offset+4:offset+6])[0] / 100.0
-            offset += 6
-            
-            # Pressure (4 bytes: pressure as uint16, altitude as int16)
-            pressure = struct.unpack('<H', data[offset:offset+2])[0]
-            baro_alt = struct.unpack('<h', data[offset+2:offset+4])[0] / 10.0
-            offset += 4
-            
-            # GPS (18 bytes)
-            lat = struct.unpack('<i', data[offset:offset+4])[0] / 1e7
-            lon = struct.unpack('<i', data[offset+4:offset+8])[0] / 1e7
-            gps_alt = struct.unpack('<i', data[offset+8:offset+12])[0] / 100.0
-            speed = struct.unpack('<H', data[offset+12:offset+14])[0] / 10.0
-            heading = struct.unpack('<H', data[offset+14:offset+16])[0] / 10.0
-            sats = data[offset+16]
-            fix_type = data[offset+17]
-            offset += 18
-            
-            # Servo Commands (8 bytes: 4x int16)
-            servo_cmds = struct.unpack('<4h', data[offset:offset+8])
-            offset += 8
-            
-            # Servo Feedback (8 bytes: 4x int16)
-            servo_fb = struct.unpack('<4h', data[offset:offset+8])
-            offset += 8
-            
-            # Servo Status (1 byte)
-            servo_status = data[offset]
-            offset += 1
-            
-            # Tracking (8 bytes: 4x int16)
-            track_x, track_y, track_w, track_h = struct.unpack('<4h', data[offset:offset+8])
-            offset += 8
-            
-            # Battery (4 bytes)
-            battery_pct = data[offset]
-            charging = data[offset+1]
-            voltage = struct.unpack('<H', data[offset+2:offset+4])[0]
-            offset += 4
-            
-            # Temperature (2 bytes)
-            temperature = struct.unpack('<h', data[offset:offset+2])[0] / 10.0
-            
-            return {
-                'timestamp': timestamp,
-                'roll': roll, 'pitch': pitch, 'yaw': yaw,
-                'accel_x': accel_x, 'accel_y': accel_y, 'accel_z': accel_z,
-                'pressure': pressure, 'baro_alt': baro_alt,
-                'lat': lat, 'lon': lon, 'gps_alt': gps_alt,
-                'speed': speed, 'heading': heading, 'sats': sats, 'fix': fix_type,
-                'servo_cmds': servo_cmds, 'servo_fb': servo_fb, 'servo_status': servo_status,
-                'track_x': track_x, 'track_y': track_y, 'track_w': track_w, 'track_h': track_h,
-                'battery': battery_pct, 'charging': charging, 'voltage': voltage,
-                'temperature': temperature
-            }
+            # Single unpack of the whole payload (offset 3 skips header+length)
+            (timestamp,
+             roll_i, pitch_i, yaw_i,
+             ax_i, ay_i, az_i,
+             pressure, baro_i,
+             lat_i, lon_i, gps_alt_i, speed_i, heading_i, sats, fix_type,
+             s1c, s2c, s3c, s4c,
+             s1f, s2f, s3f, s4f,
+             servo_status,
+             track_x, track_y, track_w, track_h,
+             battery_pct, charging, voltage,
+             temp_i) = _FRAME_STRUCT.unpack_from(data, 3)
+
+            # Orientation: int16 scaled by 10
+            roll = roll_i * _S10
+            pitch = pitch_i * _S10
+            yaw = yaw_i * _S10
+
+            # Accelerometer: int16 scaled by 100
+            accel_x = ax_i * _S100
+            accel_y = ay_i * _S100
+            accel_z = az_i * _S100
+
+            # Barometer altitude: int16 scaled by 10
+            baro_alt = baro_i * _S10
+
+            # GPS
+            lat = lat_i * _S1E7
+            lon = lon_i * _S1E7
+            gps_alt = gps_alt_i * _S100
+            speed = speed_i * _S10
+            heading = heading_i * _S10
+
+            servo_cmds = (s1c, s2c, s3c, s4c)
+            servo_fb = (s1f, s2f, s3f, s4f)
+
+            # Temperature: int16 scaled by 10
+            temperature = temp_i * _S10
+
+            return TelemetryFrame(
+                timestamp=timestamp,
+                roll=roll, pitch=pitch, yaw=yaw,
+                accel_x=accel_x, accel_y=accel_y, accel_z=accel_z,
+                pressure=pressure, baro_alt=baro_alt,
+                lat=lat, lon=lon, gps_alt=gps_alt,
+                speed=speed, heading=heading, sats=sats, fix=fix_type,
+                servo_cmds=servo_cmds, servo_fb=servo_fb, servo_status=servo_status,
+                track_x=track_x, track_y=track_y, track_w=track_w, track_h=track_h,
+                battery=battery_pct, charging=charging, voltage=voltage,
+                temperature=temperature
+            )
         except Exception as e:
             print(f"Parse error: {e}")
             return None
@@ -204,11 +370,27 @@ class PlotWidget(FigureCanvas):
         self.colors = colors or ['#00ff88']
         self.max_points = max_points
         
-        self.data = {label: deque(maxlen=max_points) for label in self.labels}
+        # Preallocated per-series buffers: row i holds the series for
+        # labels[i], filled up to _count and shifted in place when full.
+        # No per-tick list/array rebuilds.
+        self._y = np.empty((len(self.labels), max_points), dtype=np.float32)
+        self._x = np.arange(max_points, dtype=np.float32)
+        self._count = 0
         self.lines = {}
-        
+        self._ylim = None
+        self._xmax = 0
+        # Monotonic deques (value, append index) per series: O(1) amortized
+        # rolling min/max over the window, replacing full scans per tick.
+        self._total = 0
+        self._min_dq = [deque() for _ in self.labels]
+        self._max_dq = [deque() for _ in self.labels]
+        # Cached background for blitting; invalidated on resize and on
+        # axis-limit changes, which force one full draw to re-cache it.
+        self._bg = None
+
         for label, color in zip(self.labels, self.colors):
             line, = self.ax.plot([], [], color=color, linewidth=1.5, label=label)
+            line.set_animated(True)  # excluded from full draws, blitted on top
             self.lines[label] = line
         
         if len(self.labels) > 1:
@@ -217,25 +399,84 @@ class PlotWidget(FigureCanvas):
         
         self.fig.tight_layout()
     
-    def update_data(self, values: dict):
-        """Update plot with new values"""
-        for label, value in values.items():
-            if label in self.data:
-                self.data[label].append(value)
-        
-        for label, line in self.lines.items():
-            y_data = list(self.data[label])
-            x_data = list(range(len(y_data)))
-            line.set_data(x_data, y_data)
-        
-        if any(self.data.values()):
-            all_data = [v for d in self.data.values() for v in d]
-            if all_data:
-                self.ax.set_xlim(0, max(len(d) for d in self.data.values()))
-                margin = (max(all_data) - min(all_data)) * 0.1 + 0.1
-                self.ax.set_ylim(min(all_data) - margin, max(all_data) + margin)
-        
-        self.draw()
+    def update_data(self, values):
+        """Update plot with new values, one per label in label order"""
+        if self._count < self.max_points:
+            col = self._count
+            self._count += 1
+        else:
+            # Shift left in place (single C memmove per row); keeps the
+            # buffer compacted so drawing uses plain contiguous views.
+            self._y[:, :-1] = self._y[:, 1:]
+            col = self.max_points - 1
+        self._y[:, col] = values
+
+        # Maintain rolling min/max in O(1) amortized per append
+        idx = self._total
+        self._total += 1
+        cutoff = idx - self.max_points
+        for i in range(len(self.labels)):
+            v = float(self._y[i, col])
+            dq = self._min_dq[i]
+            while dq and dq[-1][0] >= v:
+                dq.pop()
+            dq.append((v, idx))
+            while dq[0][1] <= cutoff:
+                dq.popleft()
+            dq = self._max_dq[i]
+            while dq and dq[-1][0] <= v:
+                dq.pop()
+            dq.append((v, idx))
+            while dq[0][1] <= cutoff:
+                dq.popleft()
+
+        n = self._count
+        x = self._x[:n]
+        xmax = n
+        for i, label in enumerate(self.labels):
+            self.lines[label].set_data(x, self._y[i, :n])
+
+        ymin = min(dq[0][0] for dq in self._min_dq)
+        ymax = max(dq[0][0] for dq in self._max_dq)
+
+        if ymin is not None:
+            if xmax != self._xmax:
+                self.ax.set_xlim(0, xmax)
+                self._xmax = xmax
+                self._bg = None
+
+            margin = (ymax - ymin) * 0.1 + 0.1
+            lo, hi = ymin - margin, ymax + margin
+            cur = self._ylim
+            if cur is None:
+                moved = True
+            else:
+                # Only touch matplotlib's limits when a bound moved by more
+                # than 5% of the current span; every set_ylim invalidates
+                # tick layout.
+                span = (cur[1] - cur[0]) or 1.0
+                moved = (abs(lo - cur[0]) > 0.05 * span
+                         or abs(hi - cur[1]) > 0.05 * span)
+            if moved:
+                self.ax.set_ylim(lo, hi)
+                self._ylim = (lo, hi)
+                self._bg = None
+
+        if self._bg is None:
+            # Full redraw (axes, ticks, grid, legend), then cache the pixels
+            # so steady-state updates only restore + redraw the lines.
+            self.draw()
+            self._bg = self.copy_from_bbox(self.fig.bbox)
+
+        self.restore_region(self._bg)
+        for line in self.lines.values():
+            self.ax.draw_artist(line)
+        self.blit(self.fig.bbox)
+        self.flush_events()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg = None
 
 
 # ===================== MAIN WINDOW =====================
@@ -288,7 +529,6 @@ class TelemetryViewer(QMainWindow):
         
         # Signal bridge
         self.signals = SignalBridge()
-        self.signals.new_frame.connect(self.on_new_frame)
         self.signals.raw_data.connect(self.on_raw_data)
         self.signals.status_update.connect(self.on_status_update)
         
@@ -299,9 +539,24 @@ class TelemetryViewer(QMainWindow):
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_plots)
         self.update_timer.start(50)  # 20Hz update
-        
-        # Pending data
-        self.pending_frames = []
+
+        # Hex lines wait here and are flushed to the terminal in one
+        # appendPlainText per tick; block inserts are expensive.
+        self._hex_pending = []
+        self.hex_timer = QTimer()
+        self.hex_timer.timeout.connect(self.flush_terminal)
+        self.hex_timer.start(100)
+        
+        # Redraw bookkeeping: skip ticks that would replot the same frame,
+        # and adapt the timer interval to the incoming frame rate.
+        self._last_plotted_ts = -1
+        self._fps_window = 0
+        self._fps_t0 = time.time()
+
+        # Decoded frame batches handed over from the reader thread.
+        # deque.append/popleft are atomic under the GIL, so the reader
+        # never blocks on a mutex while the GUI is mid-redraw.
+        self._frame_buf = deque()
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -430,7 +685,9 @@ class TelemetryViewer(QMainWindow):
         
         port = self.port_combo.currentData()
         try:
-            self.serial_port = serial.Serial(port, BAUD_RATE, timeout=0.1)
+            # Short timeout for low-latency wakeups; read_serial coalesces
+            # whatever has accumulated in the driver buffer per wakeup.
+            self.serial_port = serial.Serial(port, BAUD_RATE, timeout=0.02)
             self.is_connected = True
             self.connect_btn.setText("⛔ Disconnect")
             self.connect_btn.setStyleSheet("background-color: #e74c3c;")
@@ -464,13 +721,16 @@ class TelemetryViewer(QMainWindow):
         
         while self.is_connected and self.serial_port:
             try:
-                data = self.serial_port.read(256)
+                # Drain everything already buffered by the driver in one
+                # syscall instead of polling 256 bytes at a time.
+                n = self.serial_port.in_waiting or 1
+                data = self.serial_port.read(max(n, 256))
                 if data:
                     self.signals.raw_data.emit(data)
                     frames = self.parser.parse(data)
-                    for frame in frames:
-                        self.signals.new_frame.emit(frame)
-                        fps_count += 1
+                    if len(frames):
+                        self._frame_buf.append(frames)
+                        fps_count += len(frames)
                 
                 # Update FPS
                 now = time.time()
@@ -486,22 +746,16 @@ class TelemetryViewer(QMainWindow):
     
     def on_raw_data(self, data: bytes):
         """Handle raw data for terminal display"""
-        hex_str = ' '.join(f'{b:02X}' for b in data)
-        self.terminal.appendPlainText(hex_str)
-    
-    def on_new_frame(self, frame: dict):
-        """Handle parsed frame"""
-        self.pending_frames.append(frame)
-        
-        # Update status
-        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
-        self.error_label.setText(f"Errors: {self.parser.error_count}")
-        
-        # Update data display
-        self.data_label.setText(
-            f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | "
-            f"Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
-        )
+        if not self.terminal.isVisible():
+            return
+        # bytes.hex does the whole dump in one C call
+        self._hex_pending.append(data.hex(' ').upper())
+
+    def flush_terminal(self):
+        """Flush pending hex lines to the terminal in one block insert"""
+        if self._hex_pending:
+            self.terminal.appendPlainText('\n'.join(self._hex_pending))
+            self._hex_pending.clear()
     
     def on_status_update(self, status: str):
         """Handle status updates"""
@@ -509,34 +763,58 @@ class TelemetryViewer(QMainWindow):
     
     def update_plots(self):
         """Update all plots with pending data"""
-        if not self.pending_frames:
+        buf = self._frame_buf
+        batches = []
+        while True:
+            try:
+                batches.append(buf.popleft())
+            except IndexError:
+                break
+
+        if not batches:
             return
-        
+
+        # Scale the redraw rate to what is actually arriving: idle links
+        # drop to 10 Hz, fast links get 30 Hz.
+        self._fps_window += sum(len(b) for b in batches)
+        now = time.time()
+        if now - self._fps_t0 >= 1.0:
+            fps = self._fps_window / (now - self._fps_t0)
+            interval = 100 if fps < 10 else (33 if fps > 30 else 50)
+            if interval != self.update_timer.interval():
+                self.update_timer.setInterval(interval)
+            self._fps_window = 0
+            self._fps_t0 = now
+
         # Process latest frame
-        frame = self.pending_frames[-1]
-        self.pending_frames.clear()
-        
+        frame = batches[-1][-1]
+
+        # Same frame as last tick would produce identical pixels
+        ts = int(frame['timestamp'])
+        if ts == self._last_plotted_ts:
+            return
+        self._last_plotted_ts = ts
+
+        # Update status
+        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
+        self.error_label.setText(f"Errors: {self.parser.error_count}")
+
+        # Update data display
+        self.data_label.setText(
+            f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | "
+            f"Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
+        )
+
         # Orientation
-        self.orientation_plot.update_data({
-            'Roll': frame['roll'],
-            'Pitch': frame['pitch'],
-            'Yaw': frame['yaw']
-        })
-        
+        self.orientation_plot.update_data(
+            (frame['roll'], frame['pitch'], frame['yaw']))
+
         # Accelerometer
-        self.accel_plot.update_data({
-            'X': frame['accel_x'],
-            'Y': frame['accel_y'],
-            'Z': frame['accel_z']
-        })
-        
+        self.accel_plot.update_data(
+            (frame['accel_x'], frame['accel_y'], frame['accel_z']))
+
         # Servos
-        self.servo_plot.update_data({
-            'S1 Cmd': frame['servo_cmds'][0] / 10.0,
-            'S2 Cmd': frame['servo_cmds'][1] / 10.0,
-            'S3 Cmd': frame['servo_cmds'][2] / 10.0,
-            'S4 Cmd': frame['servo_cmds'][3] / 10.0
-        })
+        self.servo_plot.update_data(frame['servo_cmds'] * _S10)
     
     def closeEvent(self, event):
         """Clean up on close"""
@@ -6,6 +6,9 @@ CANphon Telemetry Viewer v3.0 - MATLAB Style
 - اضغط على أي مربع لتكبيره ملء الشاشة
 - ألوان واضحة: الأمر (أحمر) vs الاستجابة (أزرق)
 - Cursor تفاعلي + Zoom + Pan
+
+ملاحظة: للبث عالي التردد استخدم telemetry_viewer_v3_pyqtgraph.py -
+نفس الواجهة لكن بـ pyqtgraph (أسرع بكثير من matplotlib في التحديث المتدفق).
 """
 
 import sys
@@ -34,6 +37,12 @@ import serial
 import serial.tools.list_ports
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # ===================== PROTOCOL CONSTANTS =====================
 HEADER_1 = 0xAA
@@ -42,6 +51,97 @@ FRAME_SIZE = 73
 BAUD_RATE = 115200  # يجب أن يتطابق مع Android
 
 
+def _nearest_time_index(time_arr, x: float) -> int:
+    """أقرب فهرس زمني لنقطة الضغط — بحث ثنائي في C بدل مسح خطي في Python"""
+    idx = int(np.searchsorted(time_arr, x))
+    if idx <= 0:
+        return 0
+    if idx >= len(time_arr):
+        return len(time_arr) - 1
+    if x - time_arr[idx - 1] <= time_arr[idx] - x:
+        return idx - 1
+    return idx
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _servo_bounds(buf):
+        """حدود (min, max) لكل سيرفو عبر قناتي CMD وFB في مسح واحد"""
+        lo = np.empty(4, np.float32)
+        hi = np.empty(4, np.float32)
+        for s in range(4):
+            mn = buf[0, s]
+            mx = buf[0, s]
+            for j in range(buf.shape[0]):
+                a = buf[j, s]
+                b = buf[j, 4 + s]
+                if a < mn:
+                    mn = a
+                if a > mx:
+                    mx = a
+                if b < mn:
+                    mn = b
+                if b > mx:
+                    mx = b
+            lo[s] = mn
+            hi[s] = mx
+        return lo, hi
+else:
+    def _servo_bounds(buf):
+        """حدود (min, max) لكل سيرفو عبر قناتي CMD وFB - بديل numpy"""
+        lo = np.minimum(buf[:, :4].min(axis=0), buf[:, 4:].min(axis=0))
+        hi = np.maximum(buf[:, :4].max(axis=0), buf[:, 4:].max(axis=0))
+        return lo, hi
+
+
+def _limits_moved(new, last, rel_tol=0.01):
+    """هل تجاوز تغيّر الحدود 1% من المدى الحالي؟"""
+    span = (last[1] - last[0]) or 1.0
+    return (abs(new[0] - last[0]) > rel_tol * span
+            or abs(new[1] - last[1]) > rel_tol * span)
+
+
+class RingBuffer:
+    """حلقة numpy ثابتة الحجم بديلاً عن deque —
+    إضافة O(1)، فهرسة عشوائية O(1) (deque[i] تكلف O(n/64) في CPython)،
+    وعرض مرتب بدون نسخ إلا عند الالتفاف"""
+
+    # float32 halves the bytes moved per decimation/min-max/draw pass;
+    # timestamps are relative to start_time so 24-bit mantissa is plenty
+    def __init__(self, capacity, dtype=np.float32):
+        self.a = np.empty(capacity, dtype=dtype)
+        self.capacity = capacity
+        self.head = 0  # next write slot
+        self.count = 0
+
+    def append(self, value):
+        self.a[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def view(self):
+        """المحتوى بالترتيب الزمني — شريحة بدون نسخ ما لم تلتف الحلقة"""
+        if self.count < self.capacity or self.head == 0:
+            return self.a[:self.count]
+        return np.concatenate((self.a[self.head:], self.a[:self.head]))
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if self.count == self.capacity:
+            return self.a[(self.head + i) % self.capacity]
+        return self.a[:self.count][i]
+
+    def __iter__(self):
+        return iter(self.view())
+
+
 # ===================== SIGNAL BRIDGE =====================
 class SignalBridge(QObject):
     new_frame = pyqtSignal(dict)
@@ -177,12 +277,30 @@ class ClickablePlotWidget(QFrame):
         self.max_points = max_points
         self.is_expanded = False
         
-        # Data storage
-        self.time_data = deque(maxlen=max_points)
-        self.data = {label: deque(maxlen=max_points) for label in labels}
+        # Data storage: preallocated numpy rings, no per-frame list rebuilds
+        self.time_data = RingBuffer(max_points)
+        self.data = {label: RingBuffer(max_points) for label in labels}
         self.start_time = time.time()
-        
+
+        # Sliding-window min/max per series via monotonic deques —
+        # O(1) amortized per append instead of a full scan per frame
+        self._appends = 0
+        self._min_dq = [deque() for _ in labels]
+        self._max_dq = [deque() for _ in labels]
+        self._ylim = None
+        self._xlim = None
+        self._dirty = False
+
+        # Cached annotation template - one C-level .format per click
+        # instead of rebuilding the label strings every time
+        self._ann_template = ("t = {:.2f}s\n"
+                              + "\n".join(f"{l}: {{:.2f}}" for l in labels))
+
         self.setup_ui()
+
+    def time_array(self):
+        """محور الزمن كمصفوفة numpy مرتبة"""
+        return self.time_data.view()
     
     def setup_ui(self):
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
@@ -231,6 +349,13 @@ class ClickablePlotWidget(QFrame):
     
     def setup_axis(self):
         self.ax.set_facecolor('#2d2d2d')
+        # Limits are managed manually - keep matplotlib's autoscale
+        # machinery out of every set_data/set_xlim call
+        self.ax.set_autoscale_on(False)
+        self.ax.set_xmargin(0)
+        self.ax.set_ymargin(0)
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(-1, 1)
         self.ax.tick_params(colors='white', labelsize=9)
         self.ax.set_xlabel('Time (s)', color='#888888', fontsize=10)
         for spine in self.ax.spines.values():
@@ -254,42 +379,57 @@ class ClickablePlotWidget(QFrame):
             fontsize=7, color='black', visible=False, zorder=100
         )
         self.cursor_vline = self.ax.axvline(x=0, color='#FFFF00', linestyle='--', linewidth=1, visible=False, zorder=99)
-        
+
+        # Cursor artists are blitted over a cached background instead of
+        # triggering a full canvas repaint on every click
+        self.cursor_annotation.set_animated(True)
+        self.cursor_vline.set_animated(True)
+        self._cursor_bg = None
+
         # Connect click event
         self.canvas.mpl_connect('button_press_event', self.on_plot_click)
-        
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event',
+                                lambda event: setattr(self, '_cursor_bg', None))
+
         self.fig.tight_layout(pad=1.0)
+
+    def _on_draw(self, event):
+        """التقاط خلفية المحور بعد كل رسم كامل لاستخدامها في الـ blitting"""
+        self._cursor_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self.cursor_annotation.get_visible():
+            self.ax.draw_artist(self.cursor_vline)
+            self.ax.draw_artist(self.cursor_annotation)
+
+    def _blit_cursor(self):
+        """رسم مؤشر القيم فقط فوق الخلفية المحفوظة (بدون إعادة رسم كامل)"""
+        if self._cursor_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._cursor_bg)
+        self.ax.draw_artist(self.cursor_vline)
+        self.ax.draw_artist(self.cursor_annotation)
+        self.canvas.blit(self.ax.bbox)
     
     def on_plot_click(self, event):
         """عند الضغط على الرسم، أظهر المربع الأصفر مع القيم"""
         if event.inaxes != self.ax or event.xdata is None:
             return
         
-        # Find nearest time point
-        time_list = list(self.time_data)
-        if not time_list:
+        # Find nearest time point (binary search on the cached array)
+        time_arr = self.time_array()
+        if not len(time_arr):
             return
-        
-        # Find closest index
+
         x_click = event.xdata
-        closest_idx = min(range(len(time_list)), key=lambda i: abs(time_list[i] - x_click))
-        t = time_list[closest_idx]
-        
-        # Build annotation text
-        text_lines = [f"t = {t:.2f}s"]
-        for label in self.labels:
-            if label in self.data and len(self.data[label]) > closest_idx:
-                value = list(self.data[label])[closest_idx]
-                text_lines.append(f"{label}: {value:.2f}")
-        
-        annotation_text = "\n".join(text_lines)
+        closest_idx = _nearest_time_index(time_arr, x_click)
+        t = float(time_arr[closest_idx])
         
-        # Get y position (use middle of visible data)
-        all_y = []
-        for label in self.labels:
-            if label in self.data and len(self.data[label]) > closest_idx:
-                all_y.append(list(self.data[label])[closest_idx])
-        y_pos = sum(all_y) / len(all_y) if all_y else 0
+        # Rings append in lockstep with the time axis - no length guards
+        values = [float(self.data[label][closest_idx]) for label in self.labels]
+        annotation_text = self._ann_template.format(t, *values)
+        finite = [v for v in values if v == v]
+        y_pos = sum(finite) / len(finite) if finite else 0
         
         # Update annotation
         self.cursor_annotation.xy = (t, y_pos)
@@ -297,9 +437,9 @@ class ClickablePlotWidget(QFrame):
         self.cursor_annotation.set_visible(True)
         self.cursor_vline.set_xdata([t])
         self.cursor_vline.set_visible(True)
-        
-        self.canvas.draw_idle()
-    
+
+        self._blit_cursor()
+
     def mousePressEvent(self, event):
         self.clicked.emit(self)
         super().mousePressEvent(event)
@@ -307,53 +447,95 @@ class ClickablePlotWidget(QFrame):
     def update_data(self, values: dict, timestamp: float = None):
         if timestamp is None:
             timestamp = time.time() - self.start_time
-        
+
         self.time_data.append(timestamp)
-        
-        for label, value in values.items():
-            if label in self.data:
-                self.data[label].append(value)
-        
-        # Smart decimation for smooth display (max 200 points visible)
-        time_list = list(self.time_data)
+
+        self._appends += 1
+        idx = self._appends
+        cutoff = idx - self.max_points
+        for i, label in enumerate(self.labels):
+            # Lockstep append: missing series get NaN so every ring stays
+            # aligned with the time axis and click lookups need no guards
+            v = float(values.get(label, np.nan))
+            self.data[label].append(v)
+
+            dq = self._min_dq[i]
+            if v == v:  # NaN never enters the min/max windows
+                while dq and dq[-1][0] >= v:
+                    dq.pop()
+                dq.append((v, idx))
+            while dq and dq[0][1] <= cutoff:
+                dq.popleft()
+
+            dq = self._max_dq[i]
+            if v == v:
+                while dq and dq[-1][0] <= v:
+                    dq.pop()
+                dq.append((v, idx))
+            while dq and dq[0][1] <= cutoff:
+                dq.popleft()
+
+        # Smart decimation for smooth display (max 200 points visible).
+        # Decimated slices are made contiguous once here; otherwise
+        # matplotlib re-copies the strided view inside every draw.
+        t_view = self.time_data.view()
+        n = len(t_view)
         max_display_points = 200
-        step = max(1, len(time_list) // max_display_points)
-        
+        step = max(1, n // max_display_points)
+        display_t = np.ascontiguousarray(t_view[::step]) if step > 1 else t_view
+
         for label, line in self.lines.items():
             if label in self.data:
-                y_data = list(self.data[label])
-                if len(y_data) == len(time_list):
-                    # Decimate for faster rendering
-                    if step > 1:
-                        display_t = time_list[::step] + [time_list[-1]]
-                        display_y = y_data[::step] + [y_data[-1]]
-                    else:
-                        display_t = time_list
-                        display_y = y_data
-                    line.set_data(display_t, display_y)
-        
-        if time_list:
+                y_view = self.data[label].view()
+                if len(y_view) == n:
+                    line.set_data(display_t,
+                                  np.ascontiguousarray(y_view[::step])
+                                  if step > 1 else y_view)
+
+        if n:
+            # Limits only move when they shift by >1% of the current span:
+            # every set_xlim/set_ylim dirties ticks and transforms.
             window = 15 if self.is_expanded else 10
-            self.ax.set_xlim(max(0, time_list[-1] - window), time_list[-1] + 0.5)
-            all_data = [v for label in self.data for v in self.data[label]]
-            if all_data:
-                margin = (max(all_data) - min(all_data)) * 0.15 + 0.5
-                self.ax.set_ylim(min(all_data) - margin, max(all_data) + margin)
-        
-        # Don't draw here - will be called once after all updates
-    
+            t_last = float(t_view[-1])
+            xlim = (max(0, t_last - window), t_last + 0.5)
+            last = self._xlim
+            if last is None or _limits_moved(xlim, last):
+                self.ax.set_xlim(*xlim)
+                self._xlim = xlim
+            if any(self._min_dq):
+                lo = min(dq[0][0] for dq in self._min_dq if dq)
+                hi = max(dq[0][0] for dq in self._max_dq if dq)
+                margin = (hi - lo) * 0.15 + 0.5
+                ylim = (lo - margin, hi + margin)
+                if self._ylim is None or _limits_moved(ylim, self._ylim):
+                    self.ax.set_ylim(*ylim)
+                    self._ylim = ylim
+
+        self._dirty = True
+        # Don't draw here - the repaint pass in update_plots calls redraw()
+
     def redraw(self):
-        """رسم الـ canvas - يُستدعى مرة واحدة بعد التحديثات"""
+        """رسم الـ canvas إذا تغيّرت البيانات - يُستدعى من منسق إعادة الرسم"""
+        if not self._dirty:
+            return
+        self._dirty = False
         self.canvas.draw_idle()
-    
+
     def clear_data(self):
         self.time_data.clear()
         for label in self.labels:
             self.data[label].clear()
+        self._appends = 0
+        for dq in self._min_dq:
+            dq.clear()
+        for dq in self._max_dq:
+            dq.clear()
+        self._ylim = None
+        self._xlim = None
         self.start_time = time.time()
         for line in self.lines.values():
             line.set_data([], [])
-        self.canvas.draw()
+        self._dirty = True
 
 
 # ===================== SERVO GROUP WIDGET (4 in 1) =====================
@@ -371,16 +553,57 @@ class ServoGroupWidget(QFrame):
         self.max_points = max_points
         self.is_expanded = False
         
-        # Data storage for all 4 servos
+        # Data storage for all 4 servos: one contiguous SoA matrix
+        # (columns 0-3 = CMD, 4-7 = FB) instead of 8 separate deques
         self.start_time = time.time()
-        self.time_data = deque(maxlen=max_points)
-        self.servo_data = {
-            i: {'CMD': deque(maxlen=max_points), 'FB': deque(maxlen=max_points)}
-            for i in range(4)
-        }
-        
+        self.time_data = RingBuffer(max_points)
+        self._servo_buf = np.empty((max_points, 8), dtype=np.float32)
+        self._servo_head = 0
+        self._servo_count = 0
+        self._last_xlim = [None] * 4
+        self._last_ylim = [None] * 4
+        self._last_ylim_update = 0.0
+        self._dirty = False
+        self._bgs = None  # per-axes blit backgrounds
+        self._full_redraw = False
+
         self.setup_ui()
-    
+
+    def _on_draw(self, event):
+        """التقاط خلفية كل محور بعد الرسم الكامل ثم رسم الخطوط المتحركة فوقها"""
+        self._bgs = [self.canvas.copy_from_bbox(ax.bbox) for ax in self.axes]
+        for i, ax in enumerate(self.axes):
+            ax.draw_artist(self.lines[i]['FB'])
+            ax.draw_artist(self.lines[i]['CMD'])
+
+    def time_array(self):
+        """محور الزمن كمصفوفة numpy مرتبة"""
+        return self.time_data.view()
+
+    def _servo_view(self):
+        """عرض مرتب زمنياً لمصفوفة السيرفو (نسخ فقط عند الالتفاف)"""
+        if self._servo_count < self.max_points:
+            return self._servo_buf[:self._servo_count]
+        if self._servo_head == 0:
+            return self._servo_buf
+        return np.concatenate((self._servo_buf[self._servo_head:],
+                               self._servo_buf[:self._servo_head]))
+
+    def cmd_view(self, i):
+        """سلسلة أوامر السيرفو i مرتبة زمنياً"""
+        return self._servo_view()[:, i]
+
+    def fb_view(self, i):
+        """سلسلة استجابة السيرفو i مرتبة زمنياً"""
+        return self._servo_view()[:, 4 + i]
+
+    def servo_at(self, idx, servo):
+        """قراءة (CMD, FB) للسيرفو عند العيّنة المنطقية idx - صف واحد بدون نسخ"""
+        if self._servo_count == self.max_points:
+            idx = (self._servo_head + idx) % self.max_points
+        row = self._servo_buf[idx]
+        return float(row[servo]), float(row[4 + servo])
+
     def setup_ui(self):
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
         self.setLineWidth(2)
@@ -423,6 +646,11 @@ class ServoGroupWidget(QFrame):
         for i in range(4):
             ax = self.fig.add_subplot(2, 2, i + 1)
             ax.set_facecolor('#2d2d2d')
+            ax.set_autoscale_on(False)
+            ax.set_xmargin(0)
+            ax.set_ymargin(0)
+            ax.set_xlim(0, 10)
+            ax.set_ylim(-90, 90)
             ax.tick_params(colors='white', labelsize=8)
             ax.set_title(self.SERVO_NAMES[i], color='white', fontsize=10, pad=4)
             for spine in ax.spines.values():
@@ -432,6 +660,9 @@ class ServoGroupWidget(QFrame):
             # FB (Blue) first, then CMD (Red) on top - like OLD project!
             line_fb, = ax.plot([], [], color='#0072BD', linewidth=2, label='FB', zorder=1)
             line_cmd, = ax.plot([], [], color='#FF0000', linewidth=2, label='CMD', zorder=2)
+            # Blitted over per-axes cached backgrounds (see redraw)
+            line_fb.set_animated(True)
+            line_cmd.set_animated(True)
             
             if i == 0:  # Legend only on first subplot
                 ax.legend(loc='upper right', fontsize=7, facecolor='#2d2d2d',
@@ -453,8 +684,14 @@ class ServoGroupWidget(QFrame):
         
         # Connect click event
         self.canvas.mpl_connect('button_press_event', self.on_servo_plot_click)
-        
-        self.fig.tight_layout(pad=1.5)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event',
+                                lambda event: setattr(self, '_bgs', None))
+
+        # Fixed geometry instead of tight_layout - tight_layout recomputes
+        # the whole layout on every figure event
+        self.fig.subplots_adjust(left=0.07, right=0.98, top=0.93,
+                                 bottom=0.08, hspace=0.35, wspace=0.2)
         layout.addWidget(self.canvas)
         
         # Legend at bottom
@@ -500,17 +737,16 @@ class ServoGroupWidget(QFrame):
             return
         
         # Find nearest time point
-        time_list = list(self.time_data)
-        if not time_list:
+        time_arr = self.time_array()
+        if not len(time_arr):
             return
-        
+
         x_click = event.xdata
-        closest_idx = min(range(len(time_list)), key=lambda i: abs(time_list[i] - x_click))
-        t = time_list[closest_idx]
-        
-        # Get CMD and FB values at this time
-        cmd_val = list(self.servo_data[clicked_ax_idx]['CMD'])[closest_idx] if len(self.servo_data[clicked_ax_idx]['CMD']) > closest_idx else 0
-        fb_val = list(self.servo_data[clicked_ax_idx]['FB'])[closest_idx] if len(self.servo_data[clicked_ax_idx]['FB']) > closest_idx else 0
+        closest_idx = _nearest_time_index(time_arr, x_click)
+        t = float(time_arr[closest_idx])
+
+        # Get CMD and FB values at this time - one row read
+        cmd_val, fb_val = self.servo_at(closest_idx, clicked_ax_idx)
         
         # Build annotation text
         annotation_text = f"t = {t:.2f}s\nCMD: {cmd_val:.1f}°\nFB: {fb_val:.1f}°"
@@ -537,59 +773,103 @@ class ServoGroupWidget(QFrame):
             timestamp = time.time() - self.start_time
         
         self.time_data.append(timestamp)
-        
-        for i in range(4):
-            self.servo_data[i]['CMD'].append(servo_cmds[i])
-            self.servo_data[i]['FB'].append(servo_fbs[i])
-        
+
+        # One indexed store replaces 8 deque appends
+        if self._servo_count < self.max_points:
+            idx = self._servo_count
+            self._servo_count += 1
+        else:
+            idx = self._servo_head
+            self._servo_head = (self._servo_head + 1) % self.max_points
+        self._servo_buf[idx, :4] = servo_cmds
+        self._servo_buf[idx, 4:] = servo_fbs
+
         # Smart decimation for smooth display (max 200 points visible)
-        time_list = list(self.time_data)
+        t_view = self.time_data.view()
+        buf = self._servo_view()
+        n = len(t_view)
         window = 15 if self.is_expanded else 10
         max_display_points = 200
-        step = max(1, len(time_list) // max_display_points)
-        
+        step = max(1, n // max_display_points)
+        display_t = np.ascontiguousarray(t_view[::step]) if step > 1 else t_view
+
+        # Recompute Y limits at most 10 times per second - the min/max scan
+        # over both channels is the expensive part of this loop
+        now = time.monotonic()
+        update_ylim = (now - self._last_ylim_update) >= 0.1
+        if update_ylim and n:
+            # One fused pass over the whole ring matrix (JIT-compiled
+            # when numba is installed) instead of 16 numpy reductions
+            lo_arr, hi_arr = _servo_bounds(buf)
+
         for i, ax in enumerate(self.axes):
-            cmd_data = list(self.servo_data[i]['CMD'])
-            fb_data = list(self.servo_data[i]['FB'])
-            
-            if len(cmd_data) == len(time_list):
-                # Decimate for faster rendering
-                if step > 1:
-                    display_t = time_list[::step] + [time_list[-1]]
-                    display_cmd = cmd_data[::step] + [cmd_data[-1]]
-                    display_fb = fb_data[::step] + [fb_data[-1]]
-                else:
-                    display_t = time_list
-                    display_cmd = cmd_data
-                    display_fb = fb_data
-                
-                self.lines[i]['CMD'].set_data(display_t, display_cmd)
-                self.lines[i]['FB'].set_data(display_t, display_fb)
-            
-            if time_list:
-                ax.set_xlim(max(0, time_list[-1] - window), time_list[-1] + 0.5)
-                all_data = cmd_data + fb_data
-                if all_data:
-                    margin = (max(all_data) - min(all_data)) * 0.15 + 1
-                    ax.set_ylim(min(all_data) - margin, max(all_data) + margin)
-        
-        # Don't draw here - will be called once after all updates
-    
+            cmd_data = buf[:, i]
+            fb_data = buf[:, 4 + i]
+
+            # All 8 lines share the same x-array object; push it with
+            # set_xdata and only feed fresh y-data per line
+            self.lines[i]['CMD'].set_xdata(display_t)
+            self.lines[i]['FB'].set_xdata(display_t)
+            self.lines[i]['CMD'].set_ydata(
+                np.ascontiguousarray(cmd_data[::step])
+                if step > 1 else np.ascontiguousarray(cmd_data))
+            self.lines[i]['FB'].set_ydata(
+                np.ascontiguousarray(fb_data[::step])
+                if step > 1 else np.ascontiguousarray(fb_data))
+
+            if n:
+                t_last = float(t_view[-1])
+                xlim = (max(0, t_last - window), t_last + 0.5)
+                if self._last_xlim[i] is None or _limits_moved(xlim, self._last_xlim[i]):
+                    ax.set_xlim(*xlim)
+                    self._last_xlim[i] = xlim
+                    self._full_redraw = True  # ticks moved - blit bg is stale
+                if update_ylim:
+                    lo = float(lo_arr[i])
+                    hi = float(hi_arr[i])
+                    margin = (hi - lo) * 0.15 + 1
+                    ylim = (lo - margin, hi + margin)
+                    if self._last_ylim[i] is None or _limits_moved(ylim, self._last_ylim[i]):
+                        ax.set_ylim(*ylim)
+                        self._last_ylim[i] = ylim
+                        self._full_redraw = True
+
+        if update_ylim:
+            self._last_ylim_update = now
+
+        self._dirty = True
+        # Don't draw here - the repaint pass in update_plots calls redraw()
+
     def redraw(self):
-        """رسم الـ canvas - يُستدعى مرة واحدة بعد التحديثات"""
-        self.canvas.draw_idle()
-    
+        """رسم إذا تغيّرت البيانات: blit للخطوط فقط ما دامت الحدود ثابتة،
+        ورسم كامل فقط عند تحرّك الحدود أو تغيّر الحجم"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        if self._full_redraw or self._bgs is None:
+            self._full_redraw = False
+            self.canvas.draw_idle()
+            return
+        for i, ax in enumerate(self.axes):
+            self.canvas.restore_region(self._bgs[i])
+            ax.draw_artist(self.lines[i]['FB'])
+            ax.draw_artist(self.lines[i]['CMD'])
+        self.canvas.blit(self.fig.bbox)
+
     def clear_data(self):
         self.time_data.clear()
-        for i in range(4):
-            self.servo_data[i]['CMD'].clear()
-            self.servo_data[i]['FB'].clear()
+        self._servo_head = 0
+        self._servo_count = 0
+        self._last_xlim = [None] * 4
+        self._last_ylim = [None] * 4
+        self._last_ylim_update = 0.0
         self.start_time = time.time()
         
         for lines in self.lines:
             lines['CMD'].set_data([], [])
             lines['FB'].set_data([], [])
-        self.canvas.draw()
+        self._full_redraw = True
+        self._dirty = True
 
 # ===================== EXPANDED VIEW =====================
 class ExpandedPlotView(QWidget):
@@ -642,6 +922,11 @@ class ExpandedPlotView(QWidget):
         
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor('#252525')
+        self.ax.set_autoscale_on(False)
+        self.ax.set_xmargin(0)
+        self.ax.set_ymargin(0)
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(-1, 1)
         self.ax.tick_params(colors='white', labelsize=10)
         self.ax.set_xlabel('Time (s)', color='white', fontsize=12)
         self.ax.set_ylabel('Value', color='white', fontsize=12)
@@ -656,7 +941,19 @@ class ExpandedPlotView(QWidget):
         layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
         
-        # Cursor annotation
+        # Cursor annotation (blitted - see _blit_cursor)
+        self._cursor_bg = None
+        self._create_cursor()
+
+        self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event',
+                                lambda event: setattr(self, '_cursor_bg', None))
+
+        self.lines = {}
+
+    def _create_cursor(self):
+        """إنشاء مؤشر القيم - يُعاد إنشاؤه بعد ax.clear()"""
         self.cursor_annotation = self.ax.annotate(
             '', xy=(0, 0), xytext=(15, 15),
             textcoords='offset points',
@@ -664,11 +961,26 @@ class ExpandedPlotView(QWidget):
             fontsize=10, visible=False
         )
         self.cursor_vline = self.ax.axvline(x=0, color='#ffff00', linestyle='--', linewidth=1, visible=False)
-        
-        self.canvas.mpl_connect('button_press_event', self.on_click)
-        
-        self.lines = {}
-    
+        self.cursor_annotation.set_animated(True)
+        self.cursor_vline.set_animated(True)
+
+    def _on_draw(self, event):
+        """التقاط خلفية المحور بعد كل رسم كامل لاستخدامها في الـ blitting"""
+        self._cursor_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self.cursor_annotation.get_visible():
+            self.ax.draw_artist(self.cursor_vline)
+            self.ax.draw_artist(self.cursor_annotation)
+
+    def _blit_cursor(self):
+        """رسم مؤشر القيم فقط فوق الخلفية المحفوظة (بدون إعادة رسم كامل)"""
+        if self._cursor_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._cursor_bg)
+        self.ax.draw_artist(self.cursor_vline)
+        self.ax.draw_artist(self.cursor_annotation)
+        self.canvas.blit(self.ax.bbox)
+
     def on_click(self, event):
         if event.inaxes != self.ax or self.current_widget is None:
             return
@@ -677,44 +989,46 @@ class ExpandedPlotView(QWidget):
         if x is None:
             return
         
-        # Find closest time point
-        time_list = list(self.current_widget.time_data)
-        if not time_list:
+        # Find closest time point (binary search on the cached array)
+        time_arr = self.current_widget.time_array()
+        if not len(time_arr):
             return
+
+        closest_idx = _nearest_time_index(time_arr, x)
+        t = float(time_arr[closest_idx])
         
-        closest_idx = min(range(len(time_list)), key=lambda i: abs(time_list[i] - x))
-        t = time_list[closest_idx]
-        
-        # Build annotation with all values
-        text_lines = [f"t = {t:.2f}s"]
-        all_y = []
-        for label in self.current_widget.labels:
-            if label in self.current_widget.data and len(self.current_widget.data[label]) > closest_idx:
-                value = list(self.current_widget.data[label])[closest_idx]
-                text_lines.append(f"{label}: {value:.2f}")
-                all_y.append(value)
-        
-        y_pos = sum(all_y) / len(all_y) if all_y else 0
-        
+        # Build annotation with all values - rings are lockstep-aligned
+        widget = self.current_widget
+        values = [float(widget.data[label][closest_idx]) for label in widget.labels]
+        finite = [v for v in values if v == v]
+        y_pos = sum(finite) / len(finite) if finite else 0
+
         self.cursor_annotation.xy = (t, y_pos)
-        self.cursor_annotation.set_text("\n".join(text_lines))
+        self.cursor_annotation.set_text(widget._ann_template.format(t, *values))
         self.cursor_annotation.set_visible(True)
         self.cursor_vline.set_xdata([t])
         self.cursor_vline.set_visible(True)
-        self.canvas.draw_idle()
-    
+        self._blit_cursor()
+
     def load_from_widget(self, widget: ClickablePlotWidget):
         self.current_widget = widget
         self.title_label.setText(f"📊 {widget.title}")
         
         self.ax.clear()
         self.ax.set_facecolor('#252525')
+        self.ax.set_autoscale_on(False)  # clear() re-enabled autoscaling
+        self.ax.set_xmargin(0)
+        self.ax.set_ymargin(0)
         self.ax.tick_params(colors='white', labelsize=10)
         self.ax.set_xlabel('Time (s)', color='white', fontsize=12)
         for spine in self.ax.spines.values():
             spine.set_color('#666666')
         self.ax.grid(True, alpha=0.4, linestyle='--')
-        
+
+        # ax.clear() dropped the cursor artists - rebuild and invalidate the blit background
+        self._create_cursor()
+        self._cursor_bg = None
+
         self.lines = {}
         time_list = list(widget.time_data)
         
@@ -735,7 +1049,7 @@ class ExpandedPlotView(QWidget):
                 self.ax.set_ylim(min(all_data) - margin, max(all_data) + margin)
         
         self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def update_from_widget(self):
         if self.current_widget is None:
@@ -825,6 +1139,11 @@ class ExpandedServoView(QWidget):
         for i in range(4):
             ax = self.fig.add_subplot(2, 2, i + 1)
             ax.set_facecolor('#252525')
+            ax.set_autoscale_on(False)
+            ax.set_xmargin(0)
+            ax.set_ymargin(0)
+            ax.set_xlim(0, 10)
+            ax.set_ylim(-90, 90)
             ax.tick_params(colors='white', labelsize=9)
             ax.set_title(self.SERVO_NAMES[i], color='white', fontsize=12, pad=8)
             ax.set_xlabel('Time (s)', color='#888888', fontsize=10)
@@ -898,17 +1217,16 @@ class ExpandedServoView(QWidget):
             return
         
         # Find nearest time point
-        time_list = list(self.current_widget.time_data)
-        if not time_list:
+        time_arr = self.current_widget.time_array()
+        if not len(time_arr):
             return
-        
+
         x_click = event.xdata
-        closest_idx = min(range(len(time_list)), key=lambda i: abs(time_list[i] - x_click))
-        t = time_list[closest_idx]
-        
-        # Get CMD and FB values
-        cmd_val = list(self.current_widget.servo_data[clicked_ax_idx]['CMD'])[closest_idx] if len(self.current_widget.servo_data[clicked_ax_idx]['CMD']) > closest_idx else 0
-        fb_val = list(self.current_widget.servo_data[clicked_ax_idx]['FB'])[closest_idx] if len(self.current_widget.servo_data[clicked_ax_idx]['FB']) > closest_idx else 0
+        closest_idx = _nearest_time_index(time_arr, x_click)
+        t = float(time_arr[closest_idx])
+
+        # Get CMD and FB values - one row read
+        cmd_val, fb_val = self.current_widget.servo_at(closest_idx, clicked_ax_idx)
         
         annotation_text = f"t = {t:.2f}s\nCMD: {cmd_val:.1f}°\nFB: {fb_val:.1f}°"
         
@@ -930,48 +1248,49 @@ class ExpandedServoView(QWidget):
     
     def load_from_servo_group(self, widget):
         self.current_widget = widget
-        
-        time_list = list(widget.time_data)
-        
+
+        time_arr = widget.time_array()
+        n = len(time_arr)
+
         for i in range(4):
-            cmd_data = list(widget.servo_data[i]['CMD'])
-            fb_data = list(widget.servo_data[i]['FB'])
-            
-            if len(cmd_data) == len(time_list):
-                self.lines[i]['CMD'].set_data(time_list, cmd_data)
-                self.lines[i]['FB'].set_data(time_list, fb_data)
-            
-            if time_list:
-                self.axes[i].set_xlim(time_list[0], time_list[-1])
-                all_data = cmd_data + fb_data
-                if all_data:
-                    margin = (max(all_data) - min(all_data)) * 0.15 + 1
-                    self.axes[i].set_ylim(min(all_data) - margin, max(all_data) + margin)
-        
-        self.canvas.draw()
-    
+            cmd_data = widget.cmd_view(i)
+            fb_data = widget.fb_view(i)
+
+            self.lines[i]['CMD'].set_data(time_arr, cmd_data)
+            self.lines[i]['FB'].set_data(time_arr, fb_data)
+
+            if n:
+                self.axes[i].set_xlim(float(time_arr[0]), float(time_arr[-1]))
+                lo = float(min(cmd_data.min(), fb_data.min()))
+                hi = float(max(cmd_data.max(), fb_data.max()))
+                margin = (hi - lo) * 0.15 + 1
+                self.axes[i].set_ylim(lo - margin, hi + margin)
+
+        self.canvas.draw_idle()
+
     def update_from_servo_group(self):
         if self.current_widget is None:
             return
-        
+
         widget = self.current_widget
-        time_list = list(widget.time_data)
-        
+        time_arr = widget.time_array()
+        n = len(time_arr)
+
         for i in range(4):
-            cmd_data = list(widget.servo_data[i]['CMD'])
-            fb_data = list(widget.servo_data[i]['FB'])
-            
-            if len(cmd_data) == len(time_list):
-                self.lines[i]['CMD'].set_data(time_list, cmd_data)
-                self.lines[i]['FB'].set_data(time_list, fb_data)
-            
-            if time_list:
-                self.axes[i].set_xlim(max(0, time_list[-1] - 20), time_list[-1] + 0.5)
-                all_data = cmd_data + fb_data
-                if all_data:
-                    margin = (max(all_data) - min(all_data)) * 0.15 + 1
-                    self.axes[i].set_ylim(min(all_data) - margin, max(all_data) + margin)
-        
+            cmd_data = widget.cmd_view(i)
+            fb_data = widget.fb_view(i)
+
+            self.lines[i]['CMD'].set_data(time_arr, cmd_data)
+            self.lines[i]['FB'].set_data(time_arr, fb_data)
+
+            if n:
+                t_last = float(time_arr[-1])
+                self.axes[i].set_xlim(max(0, t_last - 20), t_last + 0.5)
+                lo = float(min(cmd_data.min(), fb_data.min()))
+                hi = float(max(cmd_data.max(), fb_data.max()))
+                margin = (hi - lo) * 0.15 + 1
+                self.axes[i].set_ylim(lo - margin, hi + margin)
+
         self.canvas.draw_idle()
     
     def keyPressEvent(self, event):
@@ -1020,8 +1339,9 @@ class TelemetryViewerV3(QMainWindow):
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_plots)
         self.update_timer.start(16)  # 60 Hz - الأمثل لـ matplotlib
-        
+
         self.pending_frame = None
+        self._ui_dirty = False  # ticks are no-ops until new data arrives
     
     def setup_ui(self):
         central = QWidget()
@@ -1210,7 +1530,14 @@ class TelemetryViewerV3(QMainWindow):
         grid_layout.addWidget(self.tracking_plot, 2, 1)
         
         self.stacked.addWidget(self.grid_widget)
-        
+
+        # Repaint coordinator walks this list once per timer tick and
+        # issues draw_idle only for widgets whose data actually changed
+        self._plot_widgets = [
+            self.orientation_plot, self.servo_group, self.accel_plot,
+            self.gps_plot, self.battery_plot, self.tracking_plot,
+        ]
+
         # Expanded View
         self.expanded_view = ExpandedPlotView()
         self.expanded_view.close_requested.connect(self.collapse_plot)
@@ -1343,14 +1670,9 @@ class TelemetryViewerV3(QMainWindow):
     def on_new_frame(self, frame: dict):
         self.pending_frame = frame
         self.recorded_data.append(frame)
-        
-        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
-        self.error_label.setText(f"Errors: {self.parser.error_count}")
-        
-        self.data_label.setText(
-            f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | "
-            f"Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
-        )
+        self._ui_dirty = True
+        # Labels are refreshed in update_plots so bursts coalesce into
+        # one setText per timer tick instead of one per frame
     
     def on_status_update(self, status: str):
         self.fps_label.setText(status)
@@ -1380,13 +1702,28 @@ class TelemetryViewerV3(QMainWindow):
         self.terminal_text.clear()
     
     def update_plots(self):
-        if self.pending_frame is None:
+        if not self._ui_dirty:
             return
-        
+        self._ui_dirty = False
+
         frame = self.pending_frame
-        t = frame['timestamp'] / 1000.0
         self.pending_frame = None
-        
+
+        if frame is None:
+            # No new data - still flush widgets dirtied by clear_data etc.
+            for widget in self._plot_widgets:
+                widget.redraw()
+            return
+
+        t = frame['timestamp'] / 1000.0
+
+        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
+        self.error_label.setText(f"Errors: {self.parser.error_count}")
+        self.data_label.setText(
+            f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | "
+            f"Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
+        )
+
         # Orientation
         self.orientation_plot.update_data({
             'Roll': frame['roll'],
@@ -1428,14 +1765,10 @@ class TelemetryViewerV3(QMainWindow):
             'Target_Y': frame['track_y']
         }, t)
         
-        # Redraw all plots ONCE (for performance)
-        self.orientation_plot.redraw()
-        self.servo_group.redraw()
-        self.accel_plot.redraw()
-        self.gps_plot.redraw()
-        self.battery_plot.redraw()
-        self.tracking_plot.redraw()
-        
+        # Single repaint pass: at most one draw_idle per dirty widget per tick
+        for widget in self._plot_widgets:
+            widget.redraw()
+
         # Update expanded view if open
         if self.stacked.currentIndex() == 1:
             self.expanded_view.update_from_widget()
@@ -1456,6 +1789,7 @@ class TelemetryViewerV3(QMainWindow):
         
         self.frame_label.setText("Frames: 0")
         self.error_label.setText("Errors: 0")
+        self._ui_dirty = True  # flush cleared widgets on the next tick
     
     def export_csv(self):
         if not self.recorded_data:
@@ -5,6 +5,7 @@ CANphon Telemetry Viewer v3.0 - PyQtGraph Edition (FAST!)
 نفس الواجهة والمميزات مع سرعة فائقة باستخدام pyqtgraph
 """
 
+import csv
 import sys
 import struct
 import threading
@@ -15,7 +16,7 @@ from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QPushButton, QComboBox, QLabel, QFrame, QFileDialog,
-    QMessageBox, QSizePolicy, QStackedWidget, QSplitter, QTextEdit
+    QMessageBox, QSizePolicy, QStackedWidget, QSplitter, QPlainTextEdit
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
 from PyQt5.QtGui import QFont, QCursor
@@ -26,131 +27,294 @@ import numpy as np
 import serial
 import serial.tools.list_ports
 
-# Configure pyqtgraph for speed
-pg.setConfigOptions(antialias=False, useOpenGL=True, enableExperimental=True)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Configure pyqtgraph for speed. OpenGL is deliberately OFF: the grid
+# holds nine PlotWidgets and per-widget GL contexts cost more in context
+# switches/swapbuffers than the raster path with peak downsampling does.
+pg.setConfigOptions(antialias=False, useNumba=NUMBA_AVAILABLE)
 
 
 # ===================== PROTOCOL CONSTANTS =====================
 HEADER_1 = 0xAA
 HEADER_2 = 0x55
+HEADER = bytes((HEADER_1, HEADER_2))
 FRAME_SIZE = 73
 
+# Whole payload in one precompiled struct (69 bytes = FRAME_SIZE - header - checksum)
+# instead of ~20 per-field struct.unpack calls
+_FRAME_STRUCT = struct.Struct('<IhhhhhhHhiihHHBBHhhhhhhhhBhhHHBBHh')
+
+# FP multiply retires several times faster than divide; scale with
+# precomputed reciprocals everywhere frames are decoded
+_INV10 = 0.1
+_INV100 = 0.01
+_INV1E7 = 1e-7
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _decode_frame_jit(buf):
+        """فحص الـ checksum وفك كل حقول الإطار في كود مُصرَّف (بدون مفسر)"""
+        chk = 0
+        for i in range(FRAME_SIZE - 1):
+            chk ^= buf[i]
+        out = np.empty(34, np.float64)
+        if chk != buf[FRAME_SIZE - 1]:
+            return False, out
+
+        # timestamp u32 @3
+        out[0] = buf[3] | buf[4] << 8 | buf[5] << 16 | buf[6] << 24
+        # roll/pitch/yaw, accel x/y/z: i16 @7..17
+        k = 1
+        for j in range(7, 19, 2):
+            v = buf[j] | buf[j + 1] << 8
+            if v >= 32768:
+                v -= 65536
+            out[k] = v
+            k += 1
+        out[7] = buf[19] | buf[20] << 8                    # pressure u16
+        v = buf[21] | buf[22] << 8                         # baro_alt i16
+        out[8] = v - 65536 if v >= 32768 else v
+        v = buf[23] | buf[24] << 8 | buf[25] << 16 | buf[26] << 24   # lat i32
+        out[9] = v - 4294967296 if v >= 2147483648 else v
+        v = buf[27] | buf[28] << 8 | buf[29] << 16 | buf[30] << 24   # lon i32
+        out[10] = v - 4294967296 if v >= 2147483648 else v
+        v = buf[31] | buf[32] << 8                         # gps_alt i16
+        out[11] = v - 65536 if v >= 32768 else v
+        out[12] = buf[33] | buf[34] << 8                   # speed u16
+        out[13] = buf[35] | buf[36] << 8                   # heading u16
+        out[14] = buf[37]                                  # sats
+        out[15] = buf[38]                                  # fix
+        out[16] = buf[39] | buf[40] << 8                   # hdop u16
+        k = 17                                             # servo cmd/fb i16 x8 @41..55
+        for j in range(41, 57, 2):
+            v = buf[j] | buf[j + 1] << 8
+            if v >= 32768:
+                v -= 65536
+            out[k] = v
+            k += 1
+        out[25] = buf[57]                                  # servo_status
+        v = buf[58] | buf[59] << 8                         # track_x i16
+        out[26] = v - 65536 if v >= 32768 else v
+        v = buf[60] | buf[61] << 8                         # track_y i16
+        out[27] = v - 65536 if v >= 32768 else v
+        out[28] = buf[62] | buf[63] << 8                   # track_w u16
+        out[29] = buf[64] | buf[65] << 8                   # track_h u16
+        out[30] = buf[66]                                  # battery
+        out[31] = buf[67]                                  # charging
+        out[32] = buf[68] | buf[69] << 8                   # voltage u16
+        v = buf[70] | buf[71] << 8                         # temperature i16
+        out[33] = v - 65536 if v >= 32768 else v
+        return True, out
+
+
+def _frame_dict(v):
+    """تحويل متجه القيم المفكوكة إلى قاموس إطار بنفس مفاتيح _parse_frame"""
+    return {
+        'timestamp': int(v[0]),
+        'roll': v[1] * _INV10, 'pitch': v[2] * _INV10, 'yaw': v[3] * _INV10,
+        'accel_x': v[4] * _INV100, 'accel_y': v[5] * _INV100, 'accel_z': v[6] * _INV100,
+        'pressure': int(v[7]), 'baro_alt': v[8] * _INV10,
+        'lat': v[9] * _INV1E7, 'lon': v[10] * _INV1E7, 'gps_alt': int(v[11]),
+        'speed': v[12] * _INV100, 'heading': v[13] * _INV10,
+        'sats': int(v[14]), 'fix': int(v[15]), 'hdop': v[16] * _INV100,
+        'servo_cmds': [int(v[17]), int(v[18]), int(v[19]), int(v[20])],
+        'servo_fb': [int(v[21]), int(v[22]), int(v[23]), int(v[24])],
+        'servo_status': int(v[25]),
+        'track_x': int(v[26]), 'track_y': int(v[27]),
+        'track_w': int(v[28]), 'track_h': int(v[29]),
+        'battery': int(v[30]), 'charging': int(v[31]), 'voltage': int(v[32]),
+        'temperature': v[33] * _INV10
+    }
+
+
+def _decode_frames_batch(arr):
+    """فك دفعة من الإطارات المحاذاة (N, 73) بتمريرة NumPy واحدة لكل حقل"""
+    # Vectorized checksum over the whole batch, then decode valid rows only
+    ok = np.bitwise_xor.reduce(arr[:, :FRAME_SIZE - 1], axis=1) == arr[:, FRAME_SIZE - 1]
+    bad = int(len(arr) - np.count_nonzero(ok))
+    if bad:
+        arr = np.ascontiguousarray(arr[ok])
+    if len(arr) == 0:
+        return [], bad
+
+    # Each .view() reinterprets the little-endian byte columns in bulk
+    timestamp = arr[:, 3:7].view('<u4').ravel()
+    att = arr[:, 7:19].view('<i2')           # roll/pitch/yaw, accel x/y/z
+    pressure = arr[:, 19:21].view('<u2').ravel()
+    baro_alt = arr[:, 21:23].view('<i2').ravel()
+    lat = arr[:, 23:27].view('<i4').ravel()
+    lon = arr[:, 27:31].view('<i4').ravel()
+    gps_alt = arr[:, 31:33].view('<i2').ravel()
+    speed = arr[:, 33:35].view('<u2').ravel()
+    heading = arr[:, 35:37].view('<u2').ravel()
+    hdop = arr[:, 39:41].view('<u2').ravel()
+    servos = arr[:, 41:57].view('<i2')       # 4x cmd then 4x fb
+    track = arr[:, 58:62].view('<i2')
+    track_wh = arr[:, 62:66].view('<u2')
+    voltage = arr[:, 68:70].view('<u2').ravel()
+    temperature = arr[:, 70:72].view('<i2').ravel()
+
+    frames = []
+    for i in range(len(arr)):
+        row = arr[i]
+        sv = servos[i]
+        frames.append({
+            'timestamp': int(timestamp[i]),
+            'roll': att[i, 0] * _INV10, 'pitch': att[i, 1] * _INV10, 'yaw': att[i, 2] * _INV10,
+            'accel_x': att[i, 3] * _INV100, 'accel_y': att[i, 4] * _INV100, 'accel_z': att[i, 5] * _INV100,
+            'pressure': int(pressure[i]), 'baro_alt': baro_alt[i] * _INV10,
+            'lat': lat[i] * _INV1E7, 'lon': lon[i] * _INV1E7, 'gps_alt': int(gps_alt[i]),
+            'speed': speed[i] * _INV100, 'heading': heading[i] * _INV10,
+            'sats': int(row[37]), 'fix': int(row[38]), 'hdop': hdop[i] * _INV100,
+            'servo_cmds': [int(sv[0]), int(sv[1]), int(sv[2]), int(sv[3])],
+            'servo_fb': [int(sv[4]), int(sv[5]), int(sv[6]), int(sv[7])],
+            'servo_status': int(row[57]),
+            'track_x': int(track[i, 0]), 'track_y': int(track[i, 1]),
+            'track_w': int(track_wh[i, 0]), 'track_h': int(track_wh[i, 1]),
+            'battery': int(row[66]), 'charging': int(row[67]), 'voltage': int(voltage[i]),
+            'temperature': temperature[i] * _INV10
+        })
+    return frames, bad
+
+
+# Structured recording row: one packed record per frame instead of a
+# ~28-key Python dict (roughly 10x less memory over long sessions)
+REC_DTYPE = np.dtype([
+    ('timestamp', '<u4'),
+    ('roll', '<f4'), ('pitch', '<f4'), ('yaw', '<f4'),
+    ('accel_x', '<f4'), ('accel_y', '<f4'), ('accel_z', '<f4'),
+    ('pressure', '<u2'), ('baro_alt', '<f4'),
+    ('lat', '<f8'), ('lon', '<f8'), ('gps_alt', '<i2'),
+    ('speed', '<f4'), ('heading', '<f4'),
+    ('sats', 'u1'), ('fix', 'u1'), ('hdop', '<f4'),
+    ('s1_cmd', '<f4'), ('s1_fb', '<f4'), ('s2_cmd', '<f4'), ('s2_fb', '<f4'),
+    ('s3_cmd', '<f4'), ('s3_fb', '<f4'), ('s4_cmd', '<f4'), ('s4_fb', '<f4'),
+    ('battery', 'u1'), ('voltage', '<u2'), ('temperature', '<f4'),
+])
+
 
 # ===================== SIGNAL BRIDGE =====================
 class SignalBridge(QObject):
-    new_frame = pyqtSignal(dict)
+    # Frames travel through a plain deque drained by the plot timer;
+    # signals are kept for the low-rate state updates only
     status_update = pyqtSignal(str)
     raw_data = pyqtSignal(bytes)
 
 
 # ===================== FRAME PARSER =====================
 class FrameParser:
+    # Compact the backlog once the consumed prefix passes this size
+    COMPACT_THRESHOLD = 4096
+
     def __init__(self):
         self.buffer = bytearray()
+        self._rpos = 0  # read cursor - consume by advancing, not reslicing
         self.frame_count = 0
         self.error_count = 0
-    
+        if NUMBA_AVAILABLE:
+            # Warm the JIT cache before the first live frame arrives
+            _decode_frame_jit(np.zeros(FRAME_SIZE, np.uint8))
+
     def parse(self, data: bytes) -> list:
         self.buffer.extend(data)
         frames = []
-        
-        while len(self.buffer) >= FRAME_SIZE:
-            try:
-                idx = self.buffer.index(HEADER_1)
-                if idx > 0:
-                    self.buffer = self.buffer[idx:]
-                
-                if len(self.buffer) < FRAME_SIZE:
-                    break
-                
-                if self.buffer[1] != HEADER_2:
-                    self.buffer = self.buffer[1:]
+        buf = self.buffer
+        pos = self._rpos
+
+        while True:
+            # C-level two-byte search (memmem) - resync cost is linear in
+            # bytes, not in stray 0xAA occurrences
+            idx = buf.find(HEADER, pos)
+            if idx < 0:
+                # Skip the junk but keep the last byte: it may be half
+                # of a split header
+                if len(buf) - pos > 1:
+                    pos = len(buf) - 1
+                break
+            pos = idx
+
+            if len(buf) - pos < FRAME_SIZE:
+                break
+
+            avail = (len(buf) - pos) // FRAME_SIZE
+            if avail > 1:
+                # Backlog burst (e.g. after a GUI stall): grab the contiguous
+                # run of header-aligned frames and decode it in one pass
+                raw = np.frombuffer(bytes(buf[pos:pos + avail * FRAME_SIZE]),
+                                    dtype=np.uint8).reshape(avail, FRAME_SIZE)
+                aligned = (raw[:, 0] == HEADER_1) & (raw[:, 1] == HEADER_2)
+                run = avail if aligned.all() else int(np.argmin(aligned))
+                if run > 1:
+                    batch, bad = _decode_frames_batch(raw[:run])
+                    frames.extend(batch)
+                    self.frame_count += len(batch)
+                    self.error_count += bad
+                    pos += run * FRAME_SIZE
                     continue
-                
-                frame_data = bytes(self.buffer[:FRAME_SIZE])
-                self.buffer = self.buffer[FRAME_SIZE:]
-                
-                calc_checksum = 0
-                for b in frame_data[:-1]:
-                    calc_checksum ^= b
-                
-                if calc_checksum == frame_data[-1]:
-                    parsed = self._parse_frame(frame_data)
-                    if parsed:
-                        frames.append(parsed)
-                        self.frame_count += 1
+
+            frame_data = bytes(buf[pos:pos + FRAME_SIZE])
+            pos += FRAME_SIZE
+
+            if NUMBA_AVAILABLE:
+                # Checksum + full field decode in one compiled kernel
+                ok, vals = _decode_frame_jit(np.frombuffer(frame_data, dtype=np.uint8))
+                if ok:
+                    frames.append(_frame_dict(vals))
+                    self.frame_count += 1
                 else:
                     self.error_count += 1
-                    
-            except ValueError:
-                self.buffer.clear()
-                break
-        
+                continue
+
+            # One C-level XOR reduction instead of 72 interpreter iterations
+            calc_checksum = int(np.bitwise_xor.reduce(
+                np.frombuffer(frame_data, dtype=np.uint8, count=FRAME_SIZE - 1)))
+
+            if calc_checksum == frame_data[-1]:
+                parsed = self._parse_frame(frame_data)
+                if parsed:
+                    frames.append(parsed)
+                    self.frame_count += 1
+            else:
+                self.error_count += 1
+
+        # Amortized O(1): drop the consumed prefix only once it gets large
+        if pos > self.COMPACT_THRESHOLD:
+            del buf[:pos]
+            pos = 0
+        self._rpos = pos
+
         return frames
     
     def _parse_frame(self, data: bytes) -> dict:
         try:
-            offset = 3
-            timestamp = struct.unpack('<I', data[offset:offset+4])[0]
-            offset += 4
-            
-            roll = struct.unpack('<h', data[offset:offset+2])[0] / 10.0
-            pitch = struct.unpack('<h', data[offset+2:offset+4])[0] / 10.0
-            yaw = struct.unpack('<h', data[offset+4:offset+6])[0] / 10.0
-            offset += 6
-            
-            accel_x = struct.unpack('<h', data[offset:offset+2])[0] / 100.0
-            accel_y = struct.unpack('<h', data[offset+2:offset+4])[0] / 100.0
-            accel_z = struct.unpack('<h', data[offset+4:offset+6])[0] / 100.0
-            offset += 6
-            
-            pressure = struct.unpack('<H', data[offset:offset+2])[0]
-            baro_alt = struct.unpack('<h', data[offset+2:offset+4])[0] / 10.0
-            offset += 4
-            
-            lat = struct.unpack('<i', data[offset:offset+4])[0] / 1e7
-            lon = struct.unpack('<i', data[offset+4:offset+8])[0] / 1e7
-            gps_alt = struct.unpack('<h', data[offset+8:offset+10])[0]
-            speed = struct.unpack('<H', data[offset+10:offset+12])[0] / 100.0
-            heading = struct.unpack('<H', data[offset+12:offset+14])[0] / 10.0
-            sats = data[offset+14]
-            fix_type = data[offset+15]
-            hdop = struct.unpack('<H', data[offset+16:offset+18])[0] / 100.0
-            offset += 18
-            
-            servo_cmds = [struct.unpack('<h', data[offset+i*2:offset+i*2+2])[0] for i in range(4)]
-            offset += 8
-            
-            servo_fb = [struct.unpack('<h', data[offset+i*2:offset+i*2+2])[0] for i in range(4)]
-            offset += 8
-            
-            servo_status = data[offset]
-            offset += 1
-            
-            track_x = struct.unpack('<h', data[offset:offset+2])[0]
-            track_y = struct.unpack('<h', data[offset+2:offset+4])[0]
-            track_w = struct.unpack('<H', data[offset+4:offset+6])[0]
-            track_h = struct.unpack('<H', data[offset+6:offset+8])[0]
-            offset += 8
-            
-            battery_pct = data[offset]
-            charging = data[offset+1]
-            voltage = struct.unpack('<H', data[offset+2:offset+4])[0]
-            offset += 4
-            
-            temperature = struct.unpack('<h', data[offset:offset+2])[0] / 10.0
-            
+            (timestamp, roll, pitch, yaw, accel_x, accel_y, accel_z,
+             pressure, baro_alt, lat, lon, gps_alt, speed, heading,
+             sats, fix_type, hdop,
+             s1c, s2c, s3c, s4c, s1f, s2f, s3f, s4f,
+             servo_status, track_x, track_y, track_w, track_h,
+             battery_pct, charging, voltage,
+             temperature) = _FRAME_STRUCT.unpack_from(data, 3)
+
             return {
                 'timestamp': timestamp,
-                'roll': roll, 'pitch': pitch, 'yaw': yaw,
-                'accel_x': accel_x, 'accel_y': accel_y, 'accel_z': accel_z,
-                'pressure': pressure, 'baro_alt': baro_alt,
-                'lat': lat, 'lon': lon, 'gps_alt': gps_alt,
-                'speed': speed, 'heading': heading, 'sats': sats, 'fix': fix_type, 'hdop': hdop,
-                'servo_cmds': servo_cmds, 'servo_fb': servo_fb, 'servo_status': servo_status,
+                'roll': roll * _INV10, 'pitch': pitch * _INV10, 'yaw': yaw * _INV10,
+                'accel_x': accel_x * _INV100, 'accel_y': accel_y * _INV100, 'accel_z': accel_z * _INV100,
+                'pressure': pressure, 'baro_alt': baro_alt * _INV10,
+                'lat': lat * _INV1E7, 'lon': lon * _INV1E7, 'gps_alt': gps_alt,
+                'speed': speed * _INV100, 'heading': heading * _INV10,
+                'sats': sats, 'fix': fix_type, 'hdop': hdop * _INV100,
+                'servo_cmds': [s1c, s2c, s3c, s4c],
+                'servo_fb': [s1f, s2f, s3f, s4f],
+                'servo_status': servo_status,
                 'track_x': track_x, 'track_y': track_y, 'track_w': track_w, 'track_h': track_h,
                 'battery': battery_pct, 'charging': charging, 'voltage': voltage,
-                'temperature': temperature
+                'temperature': temperature * _INV10
             }
         except:
             return None
@@ -167,9 +331,13 @@ class PlotBox(QFrame):
         self.colors = colors
         self.max_points = max_points
         
-        self.time_data = deque(maxlen=max_points)
-        self.data = {label: deque(maxlen=max_points) for label in labels}
-        
+        # Double-length rings: each sample is mirrored max_points ahead, so
+        # the draw window is always one contiguous slice - no concatenate
+        self._t = np.empty(2 * max_points, np.float32)
+        self._y = {label: np.empty(2 * max_points, np.float32) for label in labels}
+        self._i = 0  # next write slot
+        self._n = 0  # valid samples
+
         self._setup_ui()
     
     def _setup_ui(self):
@@ -205,7 +373,11 @@ class PlotBox(QFrame):
         
         self.curves = {}
         for label, color in zip(self.labels, self.colors):
-            self.curves[label] = self.pw.plot(pen=pg.mkPen(color, width=2), name=label)
+            curve = self.pw.plot(pen=pg.mkPen(color, width=2, cosmetic=True), name=label)
+            # Never hand arrayToQPath more points than the widget has pixels
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+            self.curves[label] = curve
         
         layout.addWidget(self.pw, 1)
         
@@ -221,23 +393,39 @@ class PlotBox(QFrame):
         super().mousePressEvent(e)
     
     def update_data(self, values: dict, timestamp: float):
-        self.time_data.append(timestamp)
-        for label, value in values.items():
-            if label in self.data:
-                self.data[label].append(value)
-    
+        j = self._i
+        n = self.max_points
+        self._t[j] = self._t[j + n] = timestamp
+        for label in self.labels:
+            v = values.get(label, np.nan)
+            y = self._y[label]
+            y[j] = y[j + n] = v
+        self._i = (j + 1) % n
+        if self._n < n:
+            self._n += 1
+
+    def time_view(self):
+        if self._n < self.max_points:
+            return self._t[:self._n]
+        return self._t[self._i:self._i + self.max_points]
+
+    def data_view(self, label):
+        y = self._y[label]
+        if self._n < self.max_points:
+            return y[:self._n]
+        return y[self._i:self._i + self.max_points]
+
     def redraw(self):
-        if len(self.time_data) < 2:
+        if self._n < 2:
             return
-        t = np.array(self.time_data)
+        t = self.time_view()
         for label, curve in self.curves.items():
-            if label in self.data:
-                curve.setData(t, np.array(self.data[label]))
-    
+            # Ring contents are always finite - skip the per-point NaN scan
+            curve.setData(t, self.data_view(label), connect='all', skipFiniteCheck=True)
+
     def clear_data(self):
-        self.time_data.clear()
-        for d in self.data.values():
-            d.clear()
+        self._i = 0
+        self._n = 0
 
 
 # ===================== SERVO GROUP =====================
@@ -251,12 +439,13 @@ class ServoGroupWidget(QFrame):
         super().__init__()
         self.max_points = max_points
         
-        self.time_data = deque(maxlen=max_points)
-        self.servo_data = {
-            i: {'CMD': deque(maxlen=max_points), 'FB': deque(maxlen=max_points)}
-            for i in range(4)
-        }
-        
+        # Double-length rings (samples mirrored max_points ahead) so the
+        # draw window is contiguous: time plus (N, 8), cols 0-3 CMD, 4-7 FB
+        self._t = np.empty(2 * max_points, np.float32)
+        self._servo = np.empty((2 * max_points, 8), np.float32)
+        self._i = 0  # next write slot
+        self._n = 0  # valid samples
+
         self._setup_ui()
     
     def _setup_ui(self):
@@ -300,8 +489,11 @@ class ServoGroupWidget(QFrame):
             pw.getAxis('bottom').setPen('w')
             
             # Draw CMD first, then FB on top for visibility
-            cmd = pw.plot(pen=pg.mkPen('#FF0000', width=2))
-            fb = pw.plot(pen=pg.mkPen('#0072BD', width=3))  # Thicker
+            cmd = pw.plot(pen=pg.mkPen('#FF0000', width=2, cosmetic=True))
+            fb = pw.plot(pen=pg.mkPen('#0072BD', width=3, cosmetic=True))  # Thicker
+            for curve in (cmd, fb):
+                curve.setDownsampling(auto=True, method='peak')
+                curve.setClipToView(True)
             
             self.plots.append(pw)
             self.cmd_curves.append(cmd)
@@ -336,24 +528,39 @@ class ServoGroupWidget(QFrame):
         super().mousePressEvent(e)
     
     def update_data(self, servo_cmds, servo_fbs, timestamp):
-        self.time_data.append(timestamp)
-        for i in range(4):
-            self.servo_data[i]['CMD'].append(servo_cmds[i])
-            self.servo_data[i]['FB'].append(servo_fbs[i])
-    
+        j = self._i
+        n = self.max_points
+        self._t[j] = self._t[j + n] = timestamp
+        row = self._servo[j]
+        row[0:4] = servo_cmds
+        row[4:8] = servo_fbs
+        self._servo[j + n] = row
+        self._i = (j + 1) % n
+        if self._n < n:
+            self._n += 1
+
+    def time_view(self):
+        if self._n < self.max_points:
+            return self._t[:self._n]
+        return self._t[self._i:self._i + self.max_points]
+
+    def servo_view(self):
+        if self._n < self.max_points:
+            return self._servo[:self._n]
+        return self._servo[self._i:self._i + self.max_points]
+
     def redraw(self):
-        if len(self.time_data) < 2:
+        if self._n < 2:
             return
-        t = np.array(self.time_data)
+        t = self.time_view()
+        sv = self.servo_view()
         for i in range(4):
-            self.cmd_curves[i].setData(t, np.array(self.servo_data[i]['CMD']))
-            self.fb_curves[i].setData(t, np.array(self.servo_data[i]['FB']))
-    
+            self.cmd_curves[i].setData(t, sv[:, i], connect='all', skipFiniteCheck=True)
+            self.fb_curves[i].setData(t, sv[:, 4 + i], connect='all', skipFiniteCheck=True)
+
     def clear_data(self):
-        self.time_data.clear()
-        for i in range(4):
-            self.servo_data[i]['CMD'].clear()
-            self.servo_data[i]['FB'].clear()
+        self._i = 0
+        self._n = 0
 
 
 # ===================== EXPANDED VIEW =====================
@@ -403,17 +610,21 @@ class ExpandedPlotView(QWidget):
         self.curves = {}
         
         for label, color in zip(widget.labels, widget.colors):
-            self.curves[label] = self.pw.plot(pen=pg.mkPen(color, width=2), name=label)
-        
+            curve = self.pw.plot(pen=pg.mkPen(color, width=2, cosmetic=True), name=label)
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+            self.curves[label] = curve
+
         self.update_from_widget()
     
     def update_from_widget(self):
-        if self.source is None or len(self.source.time_data) < 2:
+        if self.source is None or self.source._n < 2:
             return
-        t = np.array(self.source.time_data)
+        t = self.source.time_view()
         for label in self.source.labels:
-            if label in self.curves and label in self.source.data:
-                self.curves[label].setData(t, np.array(self.source.data[label]))
+            if label in self.curves:
+                self.curves[label].setData(t, self.source.data_view(label),
+                                       connect='all', skipFiniteCheck=True)
     
     def keyPressEvent(self, e):
         if e.key() == Qt.Key_Escape:
@@ -471,8 +682,11 @@ class ExpandedServoView(QWidget):
             pw.addLegend(offset=(10, 10))
             
             # Draw CMD first (red), then FB on top (blue) for visibility
-            cmd = pw.plot(pen=pg.mkPen('#FF0000', width=2), name='CMD')
-            fb = pw.plot(pen=pg.mkPen('#0072BD', width=3), name='FB')  # Thicker line
+            cmd = pw.plot(pen=pg.mkPen('#FF0000', width=2, cosmetic=True), name='CMD')
+            fb = pw.plot(pen=pg.mkPen('#0072BD', width=3, cosmetic=True), name='FB')  # Thicker line
+            for curve in (cmd, fb):
+                curve.setDownsampling(auto=True, method='peak')
+                curve.setClipToView(True)
             
             self.plots.append(pw)
             self.cmd_curves.append(cmd)
@@ -500,12 +714,13 @@ class ExpandedServoView(QWidget):
         self.update_from_servo_group()
     
     def update_from_servo_group(self):
-        if self.source is None or len(self.source.time_data) < 2:
+        if self.source is None or self.source._n < 2:
             return
-        t = np.array(self.source.time_data)
+        t = self.source.time_view()
+        sv = self.source.servo_view()
         for i in range(4):
-            self.cmd_curves[i].setData(t, np.array(self.source.servo_data[i]['CMD']))
-            self.fb_curves[i].setData(t, np.array(self.source.servo_data[i]['FB']))
+            self.cmd_curves[i].setData(t, sv[:, i], connect='all', skipFiniteCheck=True)
+            self.fb_curves[i].setData(t, sv[:, 4 + i], connect='all', skipFiniteCheck=True)
     
     def keyPressEvent(self, e):
         if e.key() == Qt.Key_Escape:
@@ -539,23 +754,31 @@ class TelemetryViewerV3(QMainWindow):
         self.is_connected = False
         self.read_thread = None
         self.parser = FrameParser()
-        self.recorded_data = []
+        self._rec = np.empty(65536, REC_DTYPE)  # doubled on overflow
+        self._rec_n = 0
         
         self.signals = SignalBridge()
-        self.signals.new_frame.connect(self.on_new_frame)
         self.signals.status_update.connect(self.on_status_update)
         self.signals.raw_data.connect(self.on_raw_data)
         
         self.setup_ui()
         self.refresh_ports()
         
-        # 200 FPS - سرعة فائقة مع pyqtgraph!
+        # ~30 FPS redraw - ingest keeps running at full serial rate, the
+        # screen cannot show more than this anyway
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_plots)
-        self.update_timer.start(5)  # 5ms = 200 FPS
-        
-        self.pending_frames = []  # Queue instead of single frame
+        self.update_timer.start(33)
+        
+        # Reader appends, GUI timer drains - GIL-atomic on both ends, so
+        # no lock and no per-frame queued signal. Kept in-process on
+        # purpose: the plots live inside this window's stacked layout, so
+        # a shared-memory child process would need its own window plus
+        # frame serialization, and the serial read already releases the
+        # GIL while pyqtgraph paints.
+        self._fq = deque(maxlen=4096)
         self.term_count = 0
+        self._last_frame_txt = self._last_err_txt = self._last_data_txt = ''
     
     def setup_ui(self):
         central = QWidget()
@@ -619,8 +842,12 @@ class TelemetryViewerV3(QMainWindow):
         terminal_title.setStyleSheet("color: #00ff88; font-weight: bold; border: none;")
         terminal_layout.addWidget(terminal_title)
         
-        self.terminal_text = QTextEdit()
+        self.terminal_text = QPlainTextEdit()
         self.terminal_text.setReadOnly(True)
+        # Qt evicts old blocks in O(1) - no manual trimming/reflow needed
+        self.terminal_text.document().setMaximumBlockCount(500)
+        # Cached once - no attribute walk per raw-data callback
+        self._term_sb = self.terminal_text.verticalScrollBar()
         self.terminal_text.setStyleSheet("background-color: #0a0a0a; color: #00ff00; font-family: Consolas; font-size: 10px; border: none;")
         terminal_layout.addWidget(self.terminal_text)
         
@@ -772,12 +999,19 @@ class TelemetryViewerV3(QMainWindow):
         
         while self.is_connected and self.serial_port:
             try:
-                data = self.serial_port.read(256)
+                # Drain everything buffered in one syscall; with nothing
+                # waiting, block (up to the port timeout) for one frame's
+                # worth so the thread sleeps in the OS instead of polling
+                n = self.serial_port.in_waiting or FRAME_SIZE
+                data = self.serial_port.read(n)
                 if data:
                     self.signals.raw_data.emit(data)
-                    for frame in self.parser.parse(data):
-                        self.signals.new_frame.emit(frame)
-                        fps_count += 1
+                    frames = self.parser.parse(data)
+                    if frames:
+                        # Hand off through the deque - the plot timer
+                        # drains it on the GUI thread
+                        self._fq.extend(frames)
+                        fps_count += len(frames)
                 
                 now = time.time()
                 if now - last_fps_time >= 1.0:
@@ -787,13 +1021,6 @@ class TelemetryViewerV3(QMainWindow):
             except:
                 break
     
-    def on_new_frame(self, frame):
-        self.pending_frames.append(frame)  # Add to queue
-        self.recorded_data.append(frame)
-        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
-        self.error_label.setText(f"Errors: {self.parser.error_count}")
-        self.data_label.setText(f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%")
-    
     def on_status_update(self, status):
         self.fps_label.setText(status)
     
@@ -801,19 +1028,44 @@ class TelemetryViewerV3(QMainWindow):
         self.term_count += 1
         if self.term_count % 10 != 0:
             return
-        hex_str = ' '.join(f'{b:02X}' for b in data[:32])
+        # C-level conversion - one allocation instead of one per byte
+        hex_str = data[:32].hex(' ').upper()
         if len(data) > 32:
             hex_str += f' ...+{len(data)-32}B'
-        self.terminal_text.append(hex_str)
+        # Only follow the tail if the user hasn't scrolled up
+        sb = self._term_sb
+        was_bottom = sb.value() >= sb.maximum() - 4
+        self.terminal_text.appendPlainText(hex_str)
+        if was_bottom:
+            sb.setValue(sb.maximum())
     
     def update_plots(self):
-        if not self.pending_frames:
+        if not self._fq:
             return
-        
-        # Process ALL pending frames to ensure no delay
-        frames_to_process = self.pending_frames
-        self.pending_frames = []
-        
+
+        # Drain everything the reader queued since the last tick
+        fq = self._fq
+        frames_to_process = []
+        while fq:
+            frames_to_process.append(fq.popleft())
+
+        self._record(frames_to_process)
+
+        frame = frames_to_process[-1]  # labels only need the latest state
+        # Identical text still costs a layout pass + repaint - skip it
+        txt = f"Frames: {self.parser.frame_count}"
+        if txt != self._last_frame_txt:
+            self._last_frame_txt = txt
+            self.frame_label.setText(txt)
+        txt = f"Errors: {self.parser.error_count}"
+        if txt != self._last_err_txt:
+            self._last_err_txt = txt
+            self.error_label.setText(txt)
+        txt = f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
+        if txt != self._last_data_txt:
+            self._last_data_txt = txt
+            self.data_label.setText(txt)
+
         for frame in frames_to_process:
             t = frame['timestamp'] / 1000.0
             self.orientation_plot.update_data({'Roll': frame['roll'], 'Pitch': frame['pitch'], 'Yaw': frame['yaw']}, t)
@@ -823,21 +1075,49 @@ class TelemetryViewerV3(QMainWindow):
             self.battery_plot.update_data({'Battery%': frame['battery'], 'Voltage/10': frame['voltage']/100, 'Temp': frame['temperature']}, t)
             self.tracking_plot.update_data({'Target_X': frame['track_x'], 'Target_Y': frame['track_y']}, t)
         
-        # Redraw ONCE after processing all frames
-        self.orientation_plot.redraw()
-        self.servo_group.redraw()
-        self.accel_plot.redraw()
-        self.gps_plot.redraw()
-        self.battery_plot.redraw()
-        self.tracking_plot.redraw()
-        
-        if self.stacked.currentIndex() == 1:
+        # Data appends above run unconditionally so history keeps filling;
+        # the expensive redraw only goes to whatever view is visible
+        idx = self.stacked.currentIndex()
+        if idx == 0:
+            # Redraw ONCE after processing all frames, suppressing repaints
+            # so all setData calls land in one composite paint event
+            groups = (self.orientation_plot, self.servo_group, self.accel_plot,
+                      self.gps_plot, self.battery_plot, self.tracking_plot)
+            for g in groups:
+                g.setUpdatesEnabled(False)
+            try:
+                for g in groups:
+                    g.redraw()
+            finally:
+                for g in groups:
+                    g.setUpdatesEnabled(True)
+        elif idx == 1:
             self.expanded_view.update_from_widget()
-        elif self.stacked.currentIndex() == 2:
+        elif idx == 2:
             self.expanded_servo_view.update_from_servo_group()
     
+    def _record(self, frames):
+        if self._rec_n + len(frames) > len(self._rec):
+            cap = len(self._rec)
+            while cap < self._rec_n + len(frames):
+                cap *= 2
+            self._rec = np.resize(self._rec, cap)
+        for fr in frames:
+            sc = fr['servo_cmds']
+            sf = fr['servo_fb']
+            self._rec[self._rec_n] = (
+                fr['timestamp'], fr['roll'], fr['pitch'], fr['yaw'],
+                fr['accel_x'], fr['accel_y'], fr['accel_z'],
+                fr['pressure'], fr['baro_alt'],
+                fr['lat'], fr['lon'], fr['gps_alt'],
+                fr['speed'], fr['heading'],
+                fr['sats'], fr['fix'], fr['hdop'],
+                sc[0], sf[0], sc[1], sf[1], sc[2], sf[2], sc[3], sf[3],
+                fr['battery'], fr['voltage'], fr['temperature'])
+            self._rec_n += 1
+
     def clear_all(self):
-        self.recorded_data.clear()
+        self._rec_n = 0
         self.parser.frame_count = 0
         self.parser.error_count = 0
         self.orientation_plot.clear_data()
@@ -850,7 +1130,7 @@ class TelemetryViewerV3(QMainWindow):
         self.error_label.setText("Errors: 0")
     
     def export_csv(self):
-        if not self.recorded_data:
+        if self._rec_n == 0:
             QMessageBox.warning(self, "تحذير", "لا توجد بيانات")
             return
         
@@ -859,14 +1139,28 @@ class TelemetryViewerV3(QMainWindow):
             return
         
         try:
-            with open(filename, 'w') as f:
-                f.write("timestamp,roll,pitch,yaw,s1_cmd,s1_fb,s2_cmd,s2_fb,s3_cmd,s3_fb,s4_cmd,s4_fb,battery\n")
-                for r in self.recorded_data:
-                    f.write(f"{r['timestamp']},{r['roll']:.2f},{r['pitch']:.2f},{r['yaw']:.2f},")
-                    for i in range(4):
-                        f.write(f"{r['servo_cmds'][i]:.1f},{r['servo_fb'][i]:.1f},")
-                    f.write(f"{r['battery']}\n")
-            QMessageBox.information(self, "تم", f"تم تصدير {len(self.recorded_data)} إطار")
+            rec = self._rec[:self._rec_n]
+            # csv.writer formats and joins in C; the big buffer batches
+            # the writes into one syscall per MB instead of one per line
+            with open(filename, 'w', newline='', buffering=1 << 20) as f:
+                w = csv.writer(f)
+                w.writerow(['timestamp', 'roll', 'pitch', 'yaw',
+                            's1_cmd', 's1_fb', 's2_cmd', 's2_fb',
+                            's3_cmd', 's3_fb', 's4_cmd', 's4_fb', 'battery'])
+                # The angle columns must stay fixed-point text ("12.30"):
+                # rounding in float32 leaves artifacts like
+                # 12.300000190734863, so format them as strings in bulk
+                w.writerows(zip(
+                    rec['timestamp'].tolist(),
+                    np.char.mod('%.2f', rec['roll']).tolist(),
+                    np.char.mod('%.2f', rec['pitch']).tolist(),
+                    np.char.mod('%.2f', rec['yaw']).tolist(),
+                    rec['s1_cmd'].tolist(), rec['s1_fb'].tolist(),
+                    rec['s2_cmd'].tolist(), rec['s2_fb'].tolist(),
+                    rec['s3_cmd'].tolist(), rec['s3_fb'].tolist(),
+                    rec['s4_cmd'].tolist(), rec['s4_fb'].tolist(),
+                    rec['battery'].tolist()))
+            QMessageBox.information(self, "تم", f"تم تصدير {self._rec_n} إطار")
         except Exception as e:
             QMessageBox.warning(self, "خطأ", str(e))
     
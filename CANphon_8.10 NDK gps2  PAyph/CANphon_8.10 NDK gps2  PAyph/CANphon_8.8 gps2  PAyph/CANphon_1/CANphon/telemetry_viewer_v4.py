@@ -15,7 +15,6 @@ import sys
 import struct
 import threading
 import time
-from collections import deque
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
@@ -31,55 +30,132 @@ matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+import pyqtgraph as pg
+
+import numpy as np
+
 import serial
 import serial.tools.list_ports
 
+# numba is the compiled-parser path for the 2 Mbps baud setting: the
+# _scan_and_check kernel below runs the header scan and XOR at native
+# speed, and everything degrades to the pure-Python loop when numba is
+# missing. A Cython extension would do the same job but needs a build
+# step this script-only project does not have.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # ===================== PROTOCOL CONSTANTS =====================
 HEADER_1 = 0xAA
 HEADER_2 = 0x55
+HEADER = bytes((HEADER_1, HEADER_2))
 FRAME_SIZE = 73
 BAUD_RATE = 115200
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scan_and_check(buf, start):
+        """البحث عن أول إطار كامل وفحص الـ checksum في كود مُصرَّف
+
+        Returns (frame_start, status): 0 = need more data,
+        1 = valid frame, 2 = checksum mismatch.
+        """
+        i = start
+        n = buf.shape[0]
+        while i < n - 1:
+            if buf[i] == HEADER_1 and buf[i + 1] == HEADER_2:
+                if n - i < FRAME_SIZE:
+                    return i, 0
+                chk = 0
+                for j in range(i, i + FRAME_SIZE - 1):
+                    chk ^= buf[j]
+                if chk == buf[i + FRAME_SIZE - 1]:
+                    return i, 1
+                return i, 2
+            i += 1
+        return i, 0
+
+
 # ===================== SIGNAL BRIDGE =====================
 class SignalBridge(QObject):
-    new_frame = pyqtSignal(dict)
+    new_frames = pyqtSignal(list)  # one batch per serial read
     raw_data = pyqtSignal(bytes)
     status_update = pyqtSignal(str)
 
 
+# The whole frame in ONE precompiled struct - pad bytes (x) skip the
+# header and the pressure/GPS/tracking blocks that v4 never displays.
+# Fields: timestamp, roll/pitch/yaw, accel xyz, 4x servo cmd,
+# 4x servo fb, servo_status, battery, charging, voltage, temperature.
+_FRAME = struct.Struct('<3xI3h3h22x4h4hB8xBBHh')
+
+# Multiply by a reciprocal instead of dividing in the per-frame path
+_INV10 = 0.1
+_INV100 = 0.01
+
+
 # ===================== FRAME PARSER =====================
 class FrameParser:
+    # Trim consumed bytes only once this many have piled up - keeps
+    # buffer consumption O(1) amortized instead of a copy per frame
+    COMPACT_THRESHOLD = 4096
+
     def __init__(self):
         self.buffer = bytearray()
+        self._head = 0  # read cursor into self.buffer
         self.frame_count = 0
         self.error_count = 0
-    
-    def parse(self, data: bytes) -> list:
+        if NUMBA_AVAILABLE:
+            # Warm the JIT cache before the first live frame arrives
+            _scan_and_check(np.zeros(FRAME_SIZE, np.uint8), 0)
+
+    def parse(self, data: bytes, out: list) -> None:
+        """يضيف الإطارات المفكوكة إلى القائمة out بدلاً من إنشاء قائمة جديدة"""
         self.buffer.extend(data)
-        frames = []
-        
-        while len(self.buffer) >= FRAME_SIZE:
-            try:
-                idx = self.buffer.index(HEADER_1)
-                if idx > 0:
-                    self.buffer = self.buffer[idx:]
-                
-                if len(self.buffer) < FRAME_SIZE:
+        frames = out
+        pos = self._head
+
+        if NUMBA_AVAILABLE:
+            # Header scan + per-byte XOR run in compiled code; only the
+            # field decode of valid frames stays in Python
+            view = np.frombuffer(bytes(self.buffer), dtype=np.uint8)
+            while True:
+                start, status = _scan_and_check(view, pos)
+                if status == 0:
+                    pos = start
                     break
-                
-                if self.buffer[1] != HEADER_2:
-                    self.buffer = self.buffer[1:]
-                    continue
-                
-                frame_data = bytes(self.buffer[:FRAME_SIZE])
-                self.buffer = self.buffer[FRAME_SIZE:]
-                
-                calc_checksum = 0
-                for b in frame_data[:-1]:
-                    calc_checksum ^= b
-                
+                if status == 1:
+                    parsed = self._parse_frame(bytes(view[start:start + FRAME_SIZE]))
+                    if parsed:
+                        frames.append(parsed)
+                        self.frame_count += 1
+                else:
+                    self.error_count += 1
+                pos = start + FRAME_SIZE
+        else:
+            buf = self.buffer
+            while True:
+                idx = buf.find(HEADER, pos)
+                if idx < 0:
+                    # Keep the final byte - a header may straddle two reads
+                    pos = max(pos, len(buf) - 1)
+                    break
+                if len(buf) - idx < FRAME_SIZE:
+                    pos = idx
+                    break
+
+                frame_data = bytes(buf[idx:idx + FRAME_SIZE])
+                pos = idx + FRAME_SIZE
+
+                # One C-level XOR reduction instead of 72 interpreter steps
+                calc_checksum = int(np.bitwise_xor.reduce(
+                    np.frombuffer(frame_data, dtype=np.uint8, count=FRAME_SIZE - 1)))
+
                 if calc_checksum == frame_data[-1]:
                     parsed = self._parse_frame(frame_data)
                     if parsed:
@@ -87,64 +163,32 @@ class FrameParser:
                         self.frame_count += 1
                 else:
                     self.error_count += 1
-                    
-            except ValueError:
-                self.buffer.clear()
-                break
-        
-        return frames
+
+        # Advance the cursor; physically discard the consumed prefix only
+        # past the threshold
+        self._head = pos
+        if self._head >= self.COMPACT_THRESHOLD:
+            del self.buffer[:self._head]
+            self._head = 0
     
     def _parse_frame(self, data: bytes) -> dict:
         try:
-            offset = 3
-            timestamp = struct.unpack('<I', data[offset:offset+4])[0]
-            offset += 4
-            
-            roll = struct.unpack('<h', data[offset:offset+2])[0] / 10.0
-            pitch = struct.unpack('<h', data[offset+2:offset+4])[0] / 10.0
-            yaw = struct.unpack('<h', data[offset+4:offset+6])[0] / 10.0
-            offset += 6
-            
-            accel_x = struct.unpack('<h', data[offset:offset+2])[0] / 100.0
-            accel_y = struct.unpack('<h', data[offset+2:offset+4])[0] / 100.0
-            accel_z = struct.unpack('<h', data[offset+4:offset+6])[0] / 100.0
-            offset += 6
-            
-            pressure = struct.unpack('<H', data[offset:offset+2])[0]
-            baro_alt = struct.unpack('<h', data[offset+2:offset+4])[0] / 10.0
-            offset += 4
-            
-            lat = struct.unpack('<i', data[offset:offset+4])[0] / 1e7
-            lon = struct.unpack('<i', data[offset+4:offset+8])[0] / 1e7
-            offset += 18  # Skip rest of GPS
-            
-            servo_cmds = struct.unpack('<4h', data[offset:offset+8])
-            offset += 8
-            
-            servo_fb = struct.unpack('<4h', data[offset:offset+8])
-            offset += 8
-            
-            servo_status = data[offset]
-            offset += 1
-            
-            offset += 8  # Skip tracking
-            
-            battery_pct = data[offset]
-            charging = data[offset+1]
-            voltage = struct.unpack('<H', data[offset+2:offset+4])[0]
-            offset += 4
-            
-            temperature = struct.unpack('<h', data[offset:offset+2])[0] / 10.0
-            
+            # One C call decodes every displayed field at once
+            v = _FRAME.unpack_from(data)
+
             return {
-                'timestamp': timestamp,
-                'roll': roll, 'pitch': pitch, 'yaw': yaw,
-                'accel_x': accel_x, 'accel_y': accel_y, 'accel_z': accel_z,
-                'servo_cmds': [c / 10.0 for c in servo_cmds],
-                'servo_fb': [f / 10.0 for f in servo_fb],
-                'servo_status': servo_status,
-                'battery': battery_pct, 'voltage': voltage,
-                'temperature': temperature
+                'timestamp': v[0],
+                'roll': v[1] * _INV10, 'pitch': v[2] * _INV10,
+                'yaw': v[3] * _INV10,
+                'accel_x': v[4] * _INV100, 'accel_y': v[5] * _INV100,
+                'accel_z': v[6] * _INV100,
+                'servo_cmds': (v[7] * _INV10, v[8] * _INV10,
+                               v[9] * _INV10, v[10] * _INV10),
+                'servo_fb': (v[11] * _INV10, v[12] * _INV10,
+                             v[13] * _INV10, v[14] * _INV10),
+                'servo_status': v[15],
+                'battery': v[16], 'voltage': v[18],
+                'temperature': v[19] * _INV10
             }
         except Exception as e:
             print(f"Parse error: {e}")
@@ -153,114 +197,159 @@ class FrameParser:
 
 # ===================== FAST SERVO PLOT =====================
 class FastServoPlot(QWidget):
-    """Single servo plot with CMD (red) and FB (blue) - optimized for speed"""
-    
+    """Single servo plot with CMD (red) and FB (blue) - pyqtgraph backend"""
+
     def __init__(self, servo_num, max_points=500, parent=None):
         super().__init__(parent)
         self.servo_num = servo_num
         self.max_points = max_points
-        
-        # Data storage
-        self.time_data = deque(maxlen=max_points)
-        self.cmd_data = deque(maxlen=max_points)
-        self.fb_data = deque(maxlen=max_points)
+
+        # Double-length rings (samples mirrored max_points ahead) so the
+        # plot window is always a contiguous slice
+        self._t = np.empty(2 * max_points, np.float32)
+        self._cmd = np.empty(2 * max_points, np.float32)
+        self._fb = np.empty(2 * max_points, np.float32)
+        self._i = 0  # next write slot
+        self._n = 0  # valid samples
         self.start_time = time.time()
-        
+
+        # Ranges are recomputed every K samples, not per sample
+        self._autoscale_counter = 0
+        self._last_xlim = None
+        self._last_ylim = None
+
         self.setup_ui()
-    
+
+    def _view(self, buf):
+        if self._n < self.max_points:
+            return buf[:self._n]
+        return buf[self._i:self._i + self.max_points]
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(2, 2, 2, 2)
-        
-        # Small, efficient figure
-        self.fig = Figure(figsize=(4, 2), dpi=100)
-        self.fig.patch.set_facecolor('#1e1e1e')
-        self.canvas = FigureCanvas(self.fig)
-        
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_facecolor('#2d2d2d')
-        self.ax.set_title(f'Servo {self.servo_num}', color='#00ff88', fontsize=10, pad=3)
-        self.ax.tick_params(colors='white', labelsize=7)
-        for spine in self.ax.spines.values():
-            spine.set_color('#444444')
-        self.ax.grid(True, alpha=0.3, linestyle='--')
-        
-        # CMD line (red) and FB line (blue) - like MATLAB
-        self.cmd_line, = self.ax.plot([], [], color='#FF0000', linewidth=1.5, label='CMD')
-        self.fb_line, = self.ax.plot([], [], color='#0072BD', linewidth=1.5, label='FB')
-        
-        self.ax.legend(loc='upper right', fontsize=6, facecolor='#2d2d2d', 
-                      labelcolor='white', framealpha=0.8)
-        
-        # Cursor
-        self.cursor_ann = self.ax.annotate(
-            '', xy=(0, 0), xytext=(8, 8),
-            textcoords='offset points',
-            bbox=dict(boxstyle='round,pad=0.3', facecolor='#FFFF00', edgecolor='black'),
-            fontsize=7, visible=False, zorder=100
-        )
-        self.cursor_vline = self.ax.axvline(x=0, color='#FFFF00', linestyle='--', 
-                                            linewidth=1, visible=False)
-        
-        self.fig.tight_layout(pad=1.0)
-        layout.addWidget(self.canvas)
-        
+
+        self.pw = pg.PlotWidget(background='#2d2d2d')
+        self.pw.setTitle(f'Servo {self.servo_num}', color='#00ff88', size='10pt')
+        self.pw.showGrid(x=True, y=True, alpha=0.3)
+        self.pw.getAxis('left').setPen('w')
+        self.pw.getAxis('bottom').setPen('w')
+        self.pw.addLegend(offset=(10, 10))
+
+        # CMD curve (red) and FB curve (blue) - like MATLAB
+        self.cmd_curve = self.pw.plot(pen=pg.mkPen('#FF0000', width=1.5), name='CMD')
+        self.fb_curve = self.pw.plot(pen=pg.mkPen('#0072BD', width=1.5), name='FB')
+        for curve in (self.cmd_curve, self.fb_curve):
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+        # Ranges are managed manually below - keep pyqtgraph's auto-range
+        # recalculation out of the per-sample path
+        self.pw.disableAutoRange()
+
+        # Cursor: vertical marker + value readout on click
+        self.cursor_line = pg.InfiniteLine(
+            angle=90, movable=False,
+            pen=pg.mkPen('#FFFF00', style=Qt.DashLine))
+        self.cursor_line.setVisible(False)
+        self.pw.addItem(self.cursor_line)
+        self.cursor_text = pg.TextItem(color='k', fill=pg.mkBrush('#FFFF00'))
+        self.cursor_text.setVisible(False)
+        self.pw.addItem(self.cursor_text)
+
+        layout.addWidget(self.pw)
+
         # Click event for cursor
-        self.canvas.mpl_connect('button_press_event', self.on_click)
-    
+        self.pw.scene().sigMouseClicked.connect(self.on_click)
+
     def on_click(self, event):
-        if event.inaxes != self.ax or event.xdata is None:
-            return
-        
-        time_list = list(self.time_data)
-        if not time_list:
+        if self._n == 0:
             return
-        
-        idx = min(range(len(time_list)), key=lambda i: abs(time_list[i] - event.xdata))
-        t = time_list[idx]
-        
-        cmd_val = list(self.cmd_data)[idx] if idx < len(self.cmd_data) else 0
-        fb_val = list(self.fb_data)[idx] if idx < len(self.fb_data) else 0
+
+        vb = self.pw.getPlotItem().vb
+        x = vb.mapSceneToView(event.scenePos()).x()
+        times = self._view(self._t)
+        # Binary search - time is monotonic in draw order
+        idx = int(np.searchsorted(times, x))
+        if idx >= len(times):
+            idx = len(times) - 1
+        elif idx > 0 and x - times[idx - 1] < times[idx] - x:
+            idx -= 1
+        t = float(times[idx])
+
+        cmd_val = float(self._view(self._cmd)[idx])
+        fb_val = float(self._view(self._fb)[idx])
         delta = abs(cmd_val - fb_val)
-        
+
         text = f"t={t:.2f}s\nCMD: {cmd_val:.1f}°\nFB: {fb_val:.1f}°\nΔ: {delta:.1f}°"
-        
-        self.cursor_ann.xy = (t, (cmd_val + fb_val) / 2)
-        self.cursor_ann.set_text(text)
-        self.cursor_ann.set_visible(True)
-        self.cursor_vline.set_xdata([t])
-        self.cursor_vline.set_visible(True)
-        
-        self.canvas.draw_idle()
-    
+
+        self.cursor_line.setPos(t)
+        self.cursor_line.setVisible(True)
+        self.cursor_text.setText(text)
+        self.cursor_text.setPos(t, (cmd_val + fb_val) / 2)
+        self.cursor_text.setVisible(True)
+
+    def append(self, timestamp, cmd, fb):
+        """Ring write only - redraw() paints the batch in one pass"""
+        j = self._i
+        n = self.max_points
+        self._t[j] = self._t[j + n] = timestamp
+        self._cmd[j] = self._cmd[j + n] = cmd
+        self._fb[j] = self._fb[j + n] = fb
+        self._i = (j + 1) % n
+        if self._n < n:
+            self._n += 1
+
     def update_data(self, timestamp, cmd, fb):
-        self.time_data.append(timestamp)
-        self.cmd_data.append(cmd)
-        self.fb_data.append(fb)
-        
-        # Update lines
-        time_list = list(self.time_data)
-        self.cmd_line.set_data(time_list, list(self.cmd_data))
-        self.fb_line.set_data(time_list, list(self.fb_data))
-        
-        # Auto-scale
-        if time_list:
-            self.ax.set_xlim(max(0, time_list[-1] - 10), time_list[-1] + 0.5)
-            all_vals = list(self.cmd_data) + list(self.fb_data)
-            if all_vals:
-                margin = max(5, (max(all_vals) - min(all_vals)) * 0.15)
-                self.ax.set_ylim(min(all_vals) - margin, max(all_vals) + margin)
-        
-        self.canvas.draw_idle()
-    
+        self.append(timestamp, cmd, fb)
+        self.redraw()
+
+    def redraw(self):
+        if self._n == 0:
+            return
+        t = self._view(self._t)
+        cmd_v = self._view(self._cmd)
+        fb_v = self._view(self._fb)
+        self.cmd_curve.setData(t, cmd_v, connect='all', skipFiniteCheck=True)
+        self.fb_curve.setData(t, fb_v, connect='all', skipFiniteCheck=True)
+
+        # Rescale every 10th redraw only; telemetry rarely moves the
+        # range tick-to-tick
+        self._autoscale_counter += 1
+        if self._autoscale_counter % 10 and self._last_ylim is not None:
+            return
+
+        latest = float(t[-1])
+        xlim = (max(0, latest - 10), latest + 0.5)
+        if xlim != self._last_xlim:
+            self._last_xlim = xlim
+            self.pw.setXRange(*xlim, padding=0)
+
+        lo = min(float(cmd_v.min()), float(fb_v.min()))
+        hi = max(float(cmd_v.max()), float(fb_v.max()))
+        margin = max(5, (hi - lo) * 0.15)
+        ylim = (lo - margin, hi + margin)
+        if self._last_ylim is None:
+            moved = True
+        else:
+            # Ignore sub-1% drift - a new range invalidates the render
+            span = (self._last_ylim[1] - self._last_ylim[0]) or 1.0
+            moved = (abs(ylim[0] - self._last_ylim[0]) > 0.01 * span or
+                     abs(ylim[1] - self._last_ylim[1]) > 0.01 * span)
+        if moved:
+            self._last_ylim = ylim
+            self.pw.setYRange(*ylim, padding=0)
+
     def clear_data(self):
-        self.time_data.clear()
-        self.cmd_data.clear()
-        self.fb_data.clear()
+        self._i = 0
+        self._n = 0
         self.start_time = time.time()
-        self.cmd_line.set_data([], [])
-        self.fb_line.set_data([], [])
-        self.canvas.draw()
+        self._autoscale_counter = 0
+        self._last_xlim = None
+        self._last_ylim = None
+        self.cmd_curve.setData([], [])
+        self.fb_curve.setData([], [])
+        self.cursor_line.setVisible(False)
+        self.cursor_text.setVisible(False)
 
 
 # ===================== ORIENTATION PLOT =====================
@@ -271,11 +360,15 @@ class OrientationPlot(QWidget):
         super().__init__(parent)
         self.max_points = max_points
         
-        self.time_data = deque(maxlen=max_points)
-        self.roll_data = deque(maxlen=max_points)
-        self.pitch_data = deque(maxlen=max_points)
-        self.yaw_data = deque(maxlen=max_points)
-        
+        # Double-length rings (samples mirrored max_points ahead) so the
+        # plot window is always a contiguous slice - no per-update list()
+        self._t = np.empty(2 * max_points, np.float32)
+        self._roll = np.empty(2 * max_points, np.float32)
+        self._pitch = np.empty(2 * max_points, np.float32)
+        self._yaw = np.empty(2 * max_points, np.float32)
+        self._i = 0  # next write slot
+        self._n = 0  # valid samples
+
         self.setup_ui()
     
     def setup_ui(self):
@@ -297,41 +390,113 @@ class OrientationPlot(QWidget):
         self.roll_line, = self.ax.plot([], [], color='#ff6b6b', linewidth=1.5, label='Roll')
         self.pitch_line, = self.ax.plot([], [], color='#4ecdc4', linewidth=1.5, label='Pitch')
         self.yaw_line, = self.ax.plot([], [], color='#45b7d1', linewidth=1.5, label='Yaw')
-        
-        self.ax.legend(loc='upper right', fontsize=7, facecolor='#2d2d2d', 
+
+        self.ax.legend(loc='upper right', fontsize=7, facecolor='#2d2d2d',
                       labelcolor='white', framealpha=0.8)
-        
+
         self.fig.tight_layout()
         layout.addWidget(self.canvas)
+
+        # Blitting: animated lines are excluded from full draws; the static
+        # background (axes/ticks/grid) is captured once and restored per update
+        self._bg = None
+        self._xlim = None
+        self._ylim = None
+        self._autoscale_counter = 0
+        for line in (self.roll_line, self.pitch_line, self.yaw_line):
+            line.set_animated(True)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event',
+                                lambda e: setattr(self, '_bg', None))
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        for line in (self.roll_line, self.pitch_line, self.yaw_line):
+            self.ax.draw_artist(line)
     
+    def append(self, timestamp, roll, pitch, yaw):
+        """Ring write only - redraw() paints the batch in one pass"""
+        j = self._i
+        n = self.max_points
+        self._t[j] = self._t[j + n] = timestamp
+        self._roll[j] = self._roll[j + n] = roll
+        self._pitch[j] = self._pitch[j + n] = pitch
+        self._yaw[j] = self._yaw[j + n] = yaw
+        self._i = (j + 1) % n
+        if self._n < n:
+            self._n += 1
+
     def update_data(self, timestamp, roll, pitch, yaw):
-        self.time_data.append(timestamp)
-        self.roll_data.append(roll)
-        self.pitch_data.append(pitch)
-        self.yaw_data.append(yaw)
-        
-        time_list = list(self.time_data)
-        self.roll_line.set_data(time_list, list(self.roll_data))
-        self.pitch_line.set_data(time_list, list(self.pitch_data))
-        self.yaw_line.set_data(time_list, list(self.yaw_data))
-        
-        if time_list:
-            self.ax.set_xlim(max(0, time_list[-1] - 10), time_list[-1] + 0.5)
-            all_vals = list(self.roll_data) + list(self.pitch_data) + list(self.yaw_data)
-            if all_vals:
-                margin = max(5, (max(all_vals) - min(all_vals)) * 0.15)
-                self.ax.set_ylim(min(all_vals) - margin, max(all_vals) + margin)
-        
-        self.canvas.draw_idle()
-    
+        self.append(timestamp, roll, pitch, yaw)
+        self.redraw()
+
+    def redraw(self):
+        if self._n == 0:
+            return
+        n = self.max_points
+        if self._n < n:
+            sl = slice(0, self._n)
+        else:
+            sl = slice(self._i, self._i + n)
+        t = self._t[sl]
+        r = self._roll[sl]
+        p = self._pitch[sl]
+        y = self._yaw[sl]
+        self.roll_line.set_data(t, r)
+        self.pitch_line.set_data(t, p)
+        self.yaw_line.set_data(t, y)
+
+        # Rescale every 10th redraw only, and reissue the limits only when
+        # they moved beyond 1% of the current span - the 0.5s x headroom
+        # keeps the newest samples inside the window in between, so the
+        # cached background survives steady-state streaming
+        self._autoscale_counter += 1
+        if self._autoscale_counter % 10 == 0 or self._xlim is None:
+            latest = float(t[-1])
+            xlim = (max(0, latest - 10), latest + 0.5)
+            lo = min(r.min(), p.min(), y.min())
+            hi = max(r.max(), p.max(), y.max())
+            margin = max(5, (hi - lo) * 0.15)
+            ylim = (lo - margin, hi + margin)
+
+            if self._xlim is None:
+                moved = True
+            else:
+                x_span = (self._xlim[1] - self._xlim[0]) or 1.0
+                y_span = (self._ylim[1] - self._ylim[0]) or 1.0
+                moved = (abs(xlim[1] - self._xlim[1]) > 0.01 * x_span or
+                         abs(ylim[0] - self._ylim[0]) > 0.01 * y_span or
+                         abs(ylim[1] - self._ylim[1]) > 0.01 * y_span)
+            if moved:
+                # Limits moved: background is stale, full draw required
+                self._xlim = xlim
+                self._ylim = ylim
+                self.ax.set_xlim(*xlim)
+                self.ax.set_ylim(*ylim)
+                self._bg = None
+                self.canvas.draw_idle()
+                return
+
+        if self._bg is not None:
+            # Fast path: restore the cached background, redraw lines only
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self.roll_line)
+            self.ax.draw_artist(self.pitch_line)
+            self.ax.draw_artist(self.yaw_line)
+            self.canvas.blit(self.ax.bbox)
+        else:
+            self.canvas.draw_idle()
+
     def clear_data(self):
-        self.time_data.clear()
-        self.roll_data.clear()
-        self.pitch_data.clear()
-        self.yaw_data.clear()
+        self._i = 0
+        self._n = 0
         self.roll_line.set_data([], [])
         self.pitch_line.set_data([], [])
         self.yaw_line.set_data([], [])
+        self._bg = None
+        self._xlim = None
+        self._ylim = None
+        self._autoscale_counter = 0
         self.canvas.draw()
 
 
@@ -373,10 +538,13 @@ class TelemetryViewerV4(QMainWindow):
         self.is_connected = False
         self.read_thread = None
         self.parser = FrameParser()
-        self.recorded_data = []
+        # SoA recording: one row per frame in the CSV column order
+        # (timestamp, roll, pitch, yaw, s1..s4 cmd/fb, battery)
+        self._rec = np.empty((65536, 13), np.float64)  # doubled on overflow
+        self._rec_n = 0
         
         self.signals = SignalBridge()
-        self.signals.new_frame.connect(self.on_new_frame)
+        self.signals.new_frames.connect(self.on_new_frames)
         self.signals.raw_data.connect(self.on_raw_data)
         self.signals.status_update.connect(self.on_status_update)
         
@@ -388,8 +556,9 @@ class TelemetryViewerV4(QMainWindow):
         self.update_timer.timeout.connect(self.update_plots)
         self.update_timer.start(50)
         
-        self.pending_frame = None
+        self._pending = []  # frames waiting for the next plot tick
         self.terminal_counter = 0
+        self._term_pending = []  # hex lines flushed once per timer tick
     
     def setup_ui(self):
         central = QWidget()
@@ -537,16 +706,25 @@ class TelemetryViewerV4(QMainWindow):
     def read_serial(self):
         last_fps_time = time.time()
         fps_count = 0
-        
+        # Reused across frameless reads; replaced (not cleared) after an
+        # emit because the queued signal hands this same object to the
+        # GUI thread
+        frames = []
+
         while self.is_connected and self.serial_port:
             try:
-                data = self.serial_port.read(256)
+                # Drain the driver buffer in one read; block for a frame's
+                # worth when idle so the thread sleeps instead of polling
+                n = self.serial_port.in_waiting or FRAME_SIZE
+                data = self.serial_port.read(n)
                 if data:
                     self.signals.raw_data.emit(data)
-                    frames = self.parser.parse(data)
-                    for frame in frames:
-                        self.signals.new_frame.emit(frame)
-                        fps_count += 1
+                    self.parser.parse(data, frames)
+                    if frames:
+                        # One queued GUI event per read, not per frame
+                        self.signals.new_frames.emit(frames)
+                        fps_count += len(frames)
+                        frames = []
                 
                 now = time.time()
                 if now - last_fps_time >= 1.0:
@@ -565,42 +743,69 @@ class TelemetryViewerV4(QMainWindow):
         if self.terminal_counter % 5 != 0:
             return
         
-        hex_str = ' '.join(f'{b:02X}' for b in data[:24])
+        # C-level formatter - no per-byte generator/format-spec overhead
+        hex_str = data[:24].hex(' ').upper()
         if len(data) > 24:
             hex_str += f' +{len(data)-24}B'
-        self.terminal.appendPlainText(hex_str)
+        # Queue only - one appendPlainText per timer tick, not per read
+        self._term_pending.append(hex_str)
     
-    def on_new_frame(self, frame: dict):
-        self.pending_frame = frame
-        self.recorded_data.append(frame)
-        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
-        self.data_label.setText(
-            f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | "
-            f"Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
-        )
+    def on_new_frames(self, frames: list):
+        self._pending.extend(frames)
+        if self._rec_n + len(frames) > len(self._rec):
+            cap = len(self._rec)
+            while cap < self._rec_n + len(frames):
+                cap *= 2
+            self._rec = np.resize(self._rec, (cap, 13))
+        for frame in frames:
+            row = self._rec[self._rec_n]
+            row[0] = frame['timestamp']
+            row[1] = frame['roll']
+            row[2] = frame['pitch']
+            row[3] = frame['yaw']
+            row[4:12:2] = frame['servo_cmds']
+            row[5:13:2] = frame['servo_fb']
+            row[12] = frame['battery']
+            self._rec_n += 1
     
     def on_status_update(self, status: str):
         self.fps_label.setText(status)
     
     def update_plots(self):
-        if self.pending_frame is None:
+        if self._term_pending:
+            # One document re-layout for the whole batch of hex lines
+            self.terminal.appendPlainText('\n'.join(self._term_pending))
+            self._term_pending.clear()
+
+        pending = self._pending
+        if not pending:
             return
-        
-        frame = self.pending_frame
-        t = frame['timestamp'] / 1000.0
-        self.pending_frame = None
-        
-        # Update orientation
-        self.orientation_plot.update_data(t, frame['roll'], frame['pitch'], frame['yaw'])
-        
-        # Update servos
-        for i, plot in enumerate(self.servo_plots):
-            cmd = frame['servo_cmds'][i]
-            fb = frame['servo_fb'][i]
-            plot.update_data(t, cmd, fb)
+        self._pending = []
+
+        # Labels only need the latest state - refresh them at the timer
+        # rate, not once per serial batch
+        frame = pending[-1]
+        self.frame_label.setText(f"Frames: {self.parser.frame_count}")
+        self.data_label.setText(
+            f"Roll: {frame['roll']:.1f}° | Pitch: {frame['pitch']:.1f}° | "
+            f"Yaw: {frame['yaw']:.1f}° | Battery: {frame['battery']}%"
+        )
+
+        # Append the whole batch, then paint each plot once
+        for f in pending:
+            t = f['timestamp'] / 1000.0
+            self.orientation_plot.append(t, f['roll'], f['pitch'], f['yaw'])
+            cmds = f['servo_cmds']
+            fbs = f['servo_fb']
+            for i, plot in enumerate(self.servo_plots):
+                plot.append(t, cmds[i], fbs[i])
+
+        self.orientation_plot.redraw()
+        for plot in self.servo_plots:
+            plot.redraw()
     
     def clear_all(self):
-        self.recorded_data.clear()
+        self._rec_n = 0
         self.parser.frame_count = 0
         self.parser.error_count = 0
         
@@ -612,7 +817,7 @@ class TelemetryViewerV4(QMainWindow):
         self.frame_label.setText("Frames: 0")
     
     def export_csv(self):
-        if not self.recorded_data:
+        if self._rec_n == 0:
             QMessageBox.warning(self, "Warning", "No data to export")
             return
         
@@ -625,15 +830,14 @@ class TelemetryViewerV4(QMainWindow):
             return
         
         try:
-            with open(filename, 'w') as f:
-                f.write("timestamp,roll,pitch,yaw,s1_cmd,s1_fb,s2_cmd,s2_fb,s3_cmd,s3_fb,s4_cmd,s4_fb,battery\n")
-                for frame in self.recorded_data:
-                    f.write(f"{frame['timestamp']},{frame['roll']:.2f},{frame['pitch']:.2f},{frame['yaw']:.2f},")
-                    for i in range(4):
-                        f.write(f"{frame['servo_cmds'][i]:.1f},{frame['servo_fb'][i]:.1f},")
-                    f.write(f"{frame['battery']}\n")
-            
-            QMessageBox.information(self, "Success", f"Exported {len(self.recorded_data)} frames")
+            # Single C-level formatter pass over the recording matrix
+            np.savetxt(
+                filename, self._rec[:self._rec_n],
+                fmt=['%d', '%.2f', '%.2f', '%.2f'] + ['%.1f'] * 8 + ['%d'],
+                delimiter=',', comments='',
+                header="timestamp,roll,pitch,yaw,s1_cmd,s1_fb,s2_cmd,s2_fb,s3_cmd,s3_fb,s4_cmd,s4_fb,battery"
+            )
+            QMessageBox.information(self, "Success", f"Exported {self._rec_n} frames")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Export failed: {e}")
     
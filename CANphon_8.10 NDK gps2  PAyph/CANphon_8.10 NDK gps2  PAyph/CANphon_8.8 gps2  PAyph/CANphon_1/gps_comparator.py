@@ -6,6 +6,9 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import csv
 import os
+import warnings
+
+import numpy as np
 
 try:
     import matplotlib.pyplot as plt
@@ -121,63 +124,58 @@ class GPSComparator:
     
     def read_csv(self, path, lat_col, lon_col, skip_first):
         """Read CSV and filter out (0,0) and invalid points"""
-        lats, lons = [], []
-        raw_rows = []
-        skipped_zero = 0
-        skipped_invalid = 0
-        
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Detect delimiter
-        if content.count('\t') > content.count(','):
+        # Detect delimiter from the first 8 KiB only - it's uniform across
+        # the file, so scanning the whole content buys nothing
+        with open(path, 'rb') as f:
+            head = f.read(8192).decode('utf-8', 'ignore')
+        if head.count('\t') > head.count(','):
             delim = '\t'
-        elif content.count(';') > content.count(','):
+        elif head.count(';') > head.count(','):
             delim = ';'
         else:
             delim = ','
-        
-        lines = content.strip().split('\n')
-        
-        for i, line in enumerate(lines):
-            parts = line.split(delim)
-            
-            if i < 3:
-                raw_rows.append(str(parts[:7]))
-            
-            if skip_first and i == 0:
-                continue
-            
-            if len(parts) > max(lat_col, lon_col):
-                try:
-                    lat_str = parts[lat_col].strip().replace(',', '.')
-                    lon_str = parts[lon_col].strip().replace(',', '.')
-                    
-                    lat = float(lat_str)
-                    lon = float(lon_str)
-                    
-                    # ========== FILTER ==========
-                    # Skip (0,0) points - GPS not initialized
-                    if abs(lat) < 0.001 and abs(lon) < 0.001:
-                        skipped_zero += 1
-                        continue
-                    
-                    # Skip obviously invalid coordinates
-                    if lat < -90 or lat > 90 or lon < -180 or lon > 180:
-                        skipped_invalid += 1
-                        continue
-                    
-                    # Skip if lat or lon is exactly 0 (likely error)
-                    if lat == 0 or lon == 0:
-                        skipped_zero += 1
-                        continue
-                    
-                    lats.append(lat)
-                    lons.append(lon)
-                except:
-                    pass
-        
-        return lats, lons, raw_rows, skipped_zero, skipped_invalid
+
+        raw_rows = [str(line.split(delim)[:7])
+                    for line in head.splitlines()[:3]]
+
+        # Let genfromtxt split and parse every row in C; malformed rows
+        # become NaN / get skipped instead of raising per-row. The file is
+        # streamed line by line so the whole content never sits in memory;
+        # decimal commas (only possible when the delimiter isn't one) are
+        # normalized on the fly
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                rows = (line.replace(',', '.') for line in f) \
+                    if delim != ',' else f
+                arr = np.genfromtxt(rows, delimiter=delim,
+                                    usecols=(lat_col, lon_col),
+                                    skip_header=1 if skip_first else 0,
+                                    invalid_raise=False, dtype=np.float64)
+
+        if arr.size == 0:
+            return [], [], raw_rows, 0, 0
+        arr = np.atleast_2d(arr)
+        lat = arr[:, 0]
+        lon = arr[:, 1]
+
+        # ========== FILTER (same precedence as the old per-row code) ==========
+        parsed = np.isfinite(lat) & np.isfinite(lon)
+        # (0,0) points - GPS not initialized
+        near_zero = parsed & (np.abs(lat) < 0.001) & (np.abs(lon) < 0.001)
+        rest = parsed & ~near_zero
+        # Obviously invalid coordinates
+        invalid = rest & ((lat < -90) | (lat > 90) | (lon < -180) | (lon > 180))
+        rest &= ~invalid
+        # Exactly 0 lat or lon (likely error)
+        exact_zero = rest & ((lat == 0) | (lon == 0))
+        valid = rest & ~exact_zero
+
+        skipped_zero = int(near_zero.sum()) + int(exact_zero.sum())
+        skipped_invalid = int(invalid.sum())
+
+        return (lat[valid].tolist(), lon[valid].tolist(),
+                raw_rows, skipped_zero, skipped_invalid)
     
     def show_preview(self, title, lats, lons, raw_rows, skipped_zero, skipped_invalid):
         self.preview.delete('1.0', tk.END)
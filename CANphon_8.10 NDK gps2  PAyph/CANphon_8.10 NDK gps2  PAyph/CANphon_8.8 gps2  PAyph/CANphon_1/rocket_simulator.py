@@ -9,6 +9,91 @@ from matplotlib.animation import FuncAnimation
 import numpy as np
 import math
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Phase encoding shared between the numeric kernel and the class
+_PHASES = ("READY", "BOOST", "COAST", "DESCENT", "LANDED")
+_READY, _BOOST, _COAST, _DESCENT, _LANDED = range(5)
+
+# جدول كثافة الهواء 0..30 كم - استيفاء خطي بدل exp في كل خطوة
+_RHO_MAX_ALT = 30000.0
+_RHO_TAB = 1.225 * np.exp(-np.linspace(0.0, _RHO_MAX_ALT, 1024) / 8500.0)
+
+
+def _physics_step(state, mass, thrust_n, burn_time, drag_coef, angle_rad, dt,
+                  rho_tab):
+    """خطوة فيزيائية واحدة على متجه الحالة [x, y, vx, vy, t, max_alt, phase]"""
+    x = state[0]
+    y = state[1]
+    vx = state[2]
+    vy = state[3]
+    t = state[4]
+    g = 9.81
+
+    v = math.sqrt(vx * vx + vy * vy)
+
+    # Air density from the precomputed table: two loads and a fused
+    # multiply-add instead of a transcendental per step
+    last = len(rho_tab) - 1
+    pos = y * (last / _RHO_MAX_ALT)
+    if pos < 0.0:
+        pos = 0.0
+    idx = int(pos)
+    if idx >= last:
+        rho = rho_tab[last]
+    else:
+        frac = pos - idx
+        rho = rho_tab[idx] + (rho_tab[idx + 1] - rho_tab[idx]) * frac
+
+    drag = 0.5 * rho * v * v * drag_coef * 0.01
+
+    if t < burn_time:
+        phase = _BOOST
+        ax = thrust_n * math.cos(angle_rad) / mass
+        ay = thrust_n * math.sin(angle_rad) / mass - g
+    else:
+        if vy > 0:
+            phase = _COAST
+        else:
+            phase = _DESCENT
+            drag *= 15.0  # مظلة
+        if v > 0.1:
+            ax = -drag * (vx / v) / mass
+            ay = -drag * (vy / v) / mass - g
+        else:
+            ax = 0.0
+            ay = -g
+
+    vx += ax * dt
+    vy += ay * dt
+    x += vx * dt
+    y += vy * dt
+
+    if y > state[5]:
+        state[5] = y
+
+    if y <= 0 and t > 0.5:
+        y = 0.0
+        phase = _LANDED
+
+    state[0] = x
+    state[1] = y
+    state[2] = vx
+    state[3] = vy
+    state[4] = t + dt
+    state[6] = phase
+
+
+if NUMBA_AVAILABLE:
+    # Same source, compiled: the scalar math.* calls dominate this step
+    # in CPython, so the jitted version is the hot path
+    _physics_step = njit(cache=True)(_physics_step)
+
+
 class VisualRocketSimulator:
     def __init__(self):
         # إعدادات الصاروخ
@@ -26,69 +111,43 @@ class VisualRocketSimulator:
         self.time = 0.0
         self.dt = 0.02
         
-        # السجل
-        self.trail_x = []
-        self.trail_y = []
+        # السجل - مصفوفة مسبقة التخصيص بدل قوائم تنمو كل إطار
+        self._trail = np.empty((1024, 2))
+        self._trail_n = 0
         self.max_alt = 0
         self.phase = "READY"  # READY, BOOST, COAST, DESCENT, LANDED
-        
+
+        # [x, y, vx, vy, t, max_alt, phase] - the kernel's whole state
+        self._state = np.array(
+            [self.x, self.y, self.vx, self.vy, self.time, 0.0, float(_READY)])
+        if NUMBA_AVAILABLE:
+            # Warm the JIT cache before the animation starts
+            _physics_step(np.zeros(7), 1.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+                          _RHO_TAB)
+
     def update(self):
         if self.phase == "LANDED":
             return
-            
-        # قوة الدفع
-        if self.time < self.burn_time:
-            thrust = self.thrust
-            self.phase = "BOOST"
-        else:
-            thrust = 0
-            if self.vy > 0:
-                self.phase = "COAST"
-            else:
-                self.phase = "DESCENT"
-        
-        # حساب القوى
-        angle_rad = math.radians(self.angle)
-        g = 9.81
-        
-        # السرعة الكلية
-        v = math.sqrt(self.vx**2 + self.vy**2)
-        
-        # السحب
-        rho = 1.225 * math.exp(-self.y / 8500)
-        drag = 0.5 * rho * v**2 * self.drag_coef * 0.01
-        
-        if self.phase == "DESCENT":
-            drag *= 15  # مظلة
-        
-        # التسارع
-        if self.time < self.burn_time:
-            ax = thrust * math.cos(angle_rad) / self.mass
-            ay = thrust * math.sin(angle_rad) / self.mass - g
-        else:
-            if v > 0.1:
-                ax = -drag * (self.vx / v) / self.mass
-                ay = -drag * (self.vy / v) / self.mass - g
-            else:
-                ax = 0
-                ay = -g
-        
-        # تحديث السرعة والموقع
-        self.vx += ax * self.dt
-        self.vy += ay * self.dt
-        self.x += self.vx * self.dt
-        self.y += self.vy * self.dt
-        
-        if self.y > self.max_alt:
-            self.max_alt = self.y
-        
-        if self.y <= 0 and self.time > 0.5:
-            self.y = 0
-            self.phase = "LANDED"
-        
-        self.trail_x.append(self.x)
-        self.trail_y.append(self.y)
-        self.time += self.dt
+
+        _physics_step(self._state, self.mass, self.thrust, self.burn_time,
+                      self.drag_coef, math.radians(self.angle), self.dt,
+                      _RHO_TAB)
+
+        s = self._state
+        self.x = s[0]
+        self.y = s[1]
+        self.vx = s[2]
+        self.vy = s[3]
+        self.time = s[4]
+        self.max_alt = s[5]
+        self.phase = _PHASES[int(s[6])]
+
+        j = self._trail_n
+        if j >= len(self._trail):
+            self._trail = np.resize(self._trail, (2 * len(self._trail), 2))
+        self._trail[j, 0] = self.x
+        self._trail[j, 1] = self.y
+        self._trail_n = j + 1
 
 def run_visual_simulation():
     """تشغيل المحاكاة البصرية"""
@@ -169,8 +228,9 @@ def run_visual_simulation():
             rocket.update()
         
         # تحديث المسار
-        if len(rocket.trail_x) > 1:
-            trail_line.set_data(rocket.trail_x, rocket.trail_y)
+        if rocket._trail_n > 1:
+            trail = rocket._trail[:rocket._trail_n]
+            trail_line.set_data(trail[:, 0], trail[:, 1])
         
         # تحديث موقع الصاروخ
         rx = rocket.x - 4
@@ -221,17 +281,29 @@ def run_visual_simulation():
         phase_text.set_text(text)
         phase_text.set_color(color)
         
-        # تحديث حدود العرض للمتابعة
+        # تحديث حدود العرض للمتابعة - بقفزات 100م حتى لا نبطل خلفية
+        # الـ blit في كل إطار
+        y_lo, y_hi = ax.get_ylim()
         if rocket.y > 200:
-            ax.set_ylim(rocket.y - 200, rocket.y + 300)
-        elif rocket.y < 50:
-            ax.set_ylim(-30, 500)
-        
+            target_lo = (rocket.y - 200) // 100 * 100
+            new_lim = (target_lo, target_lo + 500)
+        else:
+            new_lim = (-30, 500)
+        if new_lim != (y_lo, y_hi):
+            ax.set_ylim(*new_lim)
+            # The camera moved: the cached background is stale, so force
+            # a full redraw and drop the animation's blit cache
+            if anim is not None and hasattr(anim, '_blit_cache'):
+                anim._blit_cache.clear()
+            fig.canvas.draw_idle()
+
         return trail_line, rocket_body, rocket_nose, flame, info_text, phase_text
-    
-    # تشغيل الأنيميشن
-    anim = FuncAnimation(fig, animate, init_func=init, 
-                         frames=800, interval=20, blit=False)
+
+    # تشغيل الأنيميشن - blit يرسم العناصر المتحركة فقط فوق خلفية محفوظة
+    anim = None
+    anim = FuncAnimation(fig, animate, init_func=init,
+                         frames=800, interval=20, blit=True,
+                         cache_frame_data=False)
     
     plt.tight_layout()
     plt.show()
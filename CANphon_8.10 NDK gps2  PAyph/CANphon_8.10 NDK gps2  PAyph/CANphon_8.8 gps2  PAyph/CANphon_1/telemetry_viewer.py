@@ -14,9 +14,10 @@ import sys
 import struct
 import serial
 import serial.tools.list_ports
-from collections import deque
 from datetime import datetime
 
+import numpy as np
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QComboBox, QPushButton, QLabel, QTextEdit, QGridLayout,
@@ -36,6 +37,7 @@ import matplotlib.pyplot as plt
 # =============================================================================
 FRAME_HEADER_1 = 0xAA
 FRAME_HEADER_2 = 0x55
+FRAME_HEADER = bytes((FRAME_HEADER_1, FRAME_HEADER_2))
 FRAME_LENGTH = 70
 TOTAL_FRAME_SIZE = 73
 BAUD_RATE = 115200
@@ -117,10 +119,10 @@ def parse_frame(data: bytes) -> TelemetryFrame:
     if data[0] != FRAME_HEADER_1 or data[1] != FRAME_HEADER_2:
         return None
     
-    # Verify checksum
-    checksum = 0
-    for i in range(TOTAL_FRAME_SIZE - 1):
-        checksum ^= data[i]
+    # Verify checksum - one vectorized XOR reduction instead of 72
+    # interpreter steps
+    checksum = int(np.bitwise_xor.reduce(
+        np.frombuffer(data, dtype=np.uint8, count=TOTAL_FRAME_SIZE - 1)))
     if checksum != data[TOTAL_FRAME_SIZE - 1]:
         return None
     
@@ -233,7 +235,7 @@ def parse_frame(data: bytes) -> TelemetryFrame:
 
 class SerialReaderThread(QThread):
     """Background thread for reading serial data"""
-    frame_received = pyqtSignal(object)
+    frames_received = pyqtSignal(list)  # one batch per serial read
     raw_data = pyqtSignal(bytes)
     connection_status = pyqtSignal(bool, str)
     
@@ -253,43 +255,47 @@ class SerialReaderThread(QThread):
             self.connection_status.emit(True, f"Connected to {self.port}")
             
             while self.running:
-                # Read available data
-                if self.serial.in_waiting > 0:
-                    data = self.serial.read(self.serial.in_waiting)
+                # Drain the whole driver buffer in one read; request a
+                # frame's worth when idle so the loop blocks on the port
+                # timeout instead of spinning on in_waiting
+                data = self.serial.read(self.serial.in_waiting or TOTAL_FRAME_SIZE)
+                if data:
                     self.raw_data.emit(data)
                     buffer.extend(data)
-                    
+                    frames = []
+
                     # Process complete frames
                     while len(buffer) >= TOTAL_FRAME_SIZE:
-                        # Find header
-                        header_idx = -1
-                        for i in range(len(buffer) - 1):
-                            if buffer[i] == FRAME_HEADER_1 and buffer[i+1] == FRAME_HEADER_2:
-                                header_idx = i
-                                break
-                        
+                        # Find header - one C-level scan instead of a
+                        # Python loop over every byte
+                        header_idx = buffer.find(FRAME_HEADER)
+
                         if header_idx == -1:
                             # No header found, keep last byte
                             buffer = buffer[-1:]
                             break
-                        
+
                         # Discard bytes before header
                         if header_idx > 0:
-                            buffer = buffer[header_idx:]
-                        
+                            del buffer[:header_idx]
+
                         # Need full frame
                         if len(buffer) < TOTAL_FRAME_SIZE:
                             break
-                        
+
                         # Parse frame
                         frame_data = bytes(buffer[:TOTAL_FRAME_SIZE])
                         frame = parse_frame(frame_data)
-                        
+
                         if frame:
-                            self.frame_received.emit(frame)
-                        
+                            frames.append(frame)
+
                         # Remove processed frame
-                        buffer = buffer[TOTAL_FRAME_SIZE:]
+                        del buffer[:TOTAL_FRAME_SIZE]
+
+                    if frames:
+                        # One queued GUI event per read, not per frame
+                        self.frames_received.emit(frames)
                         
         except Exception as e:
             self.connection_status.emit(False, str(e))
@@ -303,6 +309,29 @@ class SerialReaderThread(QThread):
         self.wait()
 
 
+def _decimate(x, y, target_px):
+    """Downsample (x, y) to ~2 points per pixel, preserving the envelope.
+
+    Buckets the trace into target_px groups and emits each bucket's min
+    and max interleaved, so spikes survive that plain [::step] slicing
+    would drop - and the renderer never strokes more vertices than the
+    widget has pixels.
+    """
+    n = len(x)
+    if n <= 2 * target_px:
+        return x, y
+    bucket = n // target_px
+    m = target_px * bucket
+    yb = y[:m].reshape(target_px, bucket)
+    out_y = np.empty(2 * target_px, y.dtype)
+    out_y[0::2] = yb.min(axis=1)
+    out_y[1::2] = yb.max(axis=1)
+    # Both envelope points share the bucket's first timestamp - at
+    # sub-pixel bucket widths the difference is invisible
+    out_x = np.repeat(x[:m:bucket], 2)
+    return out_x, out_y
+
+
 class PlotCanvas(FigureCanvas):
     """Reusable matplotlib canvas with dark theme"""
     def __init__(self, title="", width=4, height=2.5):
@@ -320,9 +349,81 @@ class PlotCanvas(FigureCanvas):
         
         if title:
             self.ax.set_title(title, color=COLORS['accent'], fontsize=12, fontweight='bold')
-        
+
         self.fig.tight_layout(pad=1.5)
 
+        # Blit support: every full draw caches the static background
+        # (axes, grid, legend, title); the fast path then repaints only
+        # the animated artists over it instead of re-rendering everything
+        self._bg = None
+        self._animated = []
+        self._xlim = None  # limits as last applied by _set_limits
+        self._ylim = None
+        self.mpl_connect('draw_event', self._on_draw)
+        self.mpl_connect('resize_event', self._on_resize)
+
+    def _register_animated(self, *artists):
+        """Mark artists as redrawn by hand on the blit fast path"""
+        for artist in artists:
+            artist.set_animated(True)
+        self._animated.extend(artists)
+
+    def _on_draw(self, event):
+        self._bg = self.copy_from_bbox(self.ax.bbox)
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
+
+    def _on_resize(self, event):
+        self._bg = None  # stale after a geometry change
+
+    def _blit_animated(self):
+        """Repaint the animated artists over the cached background"""
+        if self._bg is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._bg)
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
+        self.blit(self.ax.bbox)
+
+    def _set_limits(self, xlim, ylim=None):
+        """Apply axis limits only when the move is actually visible.
+
+        Any limit change forces ticks and grid to be re-laid-out, which
+        throws away the blit background - so X updates are skipped while
+        the shift is under one pixel's worth of data, and Y updates while
+        the change is under 5% of the current span. Returns True when a
+        limit was applied and a full redraw is needed.
+        """
+        changed = False
+        if xlim is not None:
+            cur = self._xlim
+            per_px = (xlim[1] - xlim[0]) / max(1, self.width())
+            if (cur is None or abs(xlim[0] - cur[0]) >= per_px
+                    or abs(xlim[1] - cur[1]) >= per_px):
+                self.ax.set_xlim(*xlim)
+                self._xlim = xlim
+                changed = True
+        if ylim is not None:
+            cur = self._ylim
+            tol = 0.0 if cur is None else 0.05 * (cur[1] - cur[0])
+            if (cur is None or abs(ylim[0] - cur[0]) > tol
+                    or abs(ylim[1] - cur[1]) > tol):
+                self.ax.set_ylim(*ylim)
+                self._ylim = ylim
+                changed = True
+        return changed
+
+    def _view(self, buf):
+        """Chronological window of a mirrored ring as one contiguous slice.
+
+        Subclasses own the rings: _i is the next write slot, _n the
+        number of valid samples.
+        """
+        if self._n < MAX_BUFFER_SIZE:
+            return buf[:self._n]
+        return buf[self._i:self._i + MAX_BUFFER_SIZE]
+
 
 class ServoPlot(PlotCanvas):
     """Servo CMD vs FB plot with diagnostic overlay"""
@@ -330,10 +431,13 @@ class ServoPlot(PlotCanvas):
         super().__init__(title=f"Servo {servo_num}")
         self.servo_num = servo_num
         
-        # Data buffers
-        self.time_data = deque(maxlen=MAX_BUFFER_SIZE)
-        self.cmd_data = deque(maxlen=MAX_BUFFER_SIZE)
-        self.fb_data = deque(maxlen=MAX_BUFFER_SIZE)
+        # Mirrored double-length rings (see OrientationPlot) - the live
+        # window stays one contiguous slice, no per-refresh copies
+        self._t = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._cmd = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._fb = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._i = 0  # next write slot
+        self._n = 0  # valid samples
         
         # Plot lines
         self.cmd_line, = self.ax.plot([], [], color=COLORS['cmd'], 
@@ -349,49 +453,51 @@ class ServoPlot(PlotCanvas):
         
         # Online status indicator
         self.status_text = self.ax.text(0.02, 0.98, '●', transform=self.ax.transAxes,
-                                         fontsize=14, color='gray', 
+                                         fontsize=14, color='gray',
                                          verticalalignment='top')
-    
+
+        self._register_animated(self.cmd_line, self.fb_line, self.status_text)
+
     def update_data(self, timestamp, cmd, fb, is_online):
         """Add new data point"""
-        self.time_data.append(timestamp / 1000.0)  # Convert to seconds
-        self.cmd_data.append(cmd)
-        self.fb_data.append(fb)
-        
+        j = self._i
+        k = j + MAX_BUFFER_SIZE
+        self._t[j] = self._t[k] = timestamp / 1000.0  # Convert to seconds
+        self._cmd[j] = self._cmd[k] = cmd
+        self._fb[j] = self._fb[k] = fb
+        self._i = (j + 1) % MAX_BUFFER_SIZE
+        if self._n < MAX_BUFFER_SIZE:
+            self._n += 1
+
         # Update online status
         color = COLORS['success'] if is_online else 'gray'
         self.status_text.set_color(color)
-    
+
     def refresh_plot(self):
         """Redraw the plot with smart decimation"""
-        if len(self.time_data) < 2:
+        if self._n < 2:
             return
-        
-        # Smart decimation for performance
-        data_len = len(self.time_data)
-        step = max(1, data_len // 300)  # Max 300 points
-        
-        times = list(self.time_data)[::step]
-        cmds = list(self.cmd_data)[::step]
-        fbs = list(self.fb_data)[::step]
-        
-        self.cmd_line.set_data(times, cmds)
-        self.fb_line.set_data(times, fbs)
-        
-        # Auto-scale X axis (show last 10 seconds)
-        if times:
-            x_max = times[-1]
-            x_min = max(0, x_max - 10)
-            self.ax.set_xlim(x_min, x_max)
-        
-        # Auto-scale Y axis with padding
-        all_vals = cmds + fbs
-        if all_vals:
-            y_min = min(all_vals) - 5
-            y_max = max(all_vals) + 5
-            self.ax.set_ylim(y_min, y_max)
-        
-        self.draw_idle()
+
+        # Envelope decimation down to screen-pixel resolution
+        target_px = max(64, self.width())
+        times = self._view(self._t)
+        cmds = self._view(self._cmd)
+        fbs = self._view(self._fb)
+
+        self.cmd_line.set_data(*_decimate(times, cmds, target_px))
+        self.fb_line.set_data(*_decimate(times, fbs, target_px))
+
+        # Auto-scale X (last 10 seconds) and Y (with padding); throttled
+        x_max = float(times[-1])
+        x_min = max(0.0, x_max - 10)
+        y_min = float(min(cmds.min(), fbs.min())) - 5
+        y_max = float(max(cmds.max(), fbs.max())) + 5
+
+        if self._set_limits((x_min, x_max), (y_min, y_max)):
+            # Ticks/grid must be re-laid-out; this also re-caches _bg
+            self.draw_idle()
+        else:
+            self._blit_animated()
 
 
 class OrientationPlot(PlotCanvas):
@@ -399,11 +505,16 @@ class OrientationPlot(PlotCanvas):
     def __init__(self):
         super().__init__(title="Orientation (Gyroscope)")
         
-        self.time_data = deque(maxlen=MAX_BUFFER_SIZE)
-        self.roll_data = deque(maxlen=MAX_BUFFER_SIZE)
-        self.pitch_data = deque(maxlen=MAX_BUFFER_SIZE)
-        self.yaw_data = deque(maxlen=MAX_BUFFER_SIZE)
-        
+        # Mirrored double-length rings: every sample is written twice,
+        # MAX_BUFFER_SIZE apart, so the live window is always one
+        # contiguous slice - no list(deque) copies per refresh
+        self._t = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._roll = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._pitch = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._yaw = np.empty(2 * MAX_BUFFER_SIZE, np.float32)
+        self._i = 0  # next write slot
+        self._n = 0  # valid samples
+
         self.roll_line, = self.ax.plot([], [], color='#ff6b6b', linewidth=1.5, label='Roll')
         self.pitch_line, = self.ax.plot([], [], color='#4ecdc4', linewidth=1.5, label='Pitch')
         self.yaw_line, = self.ax.plot([], [], color='#ffe66d', linewidth=1.5, label='Yaw')
@@ -413,35 +524,41 @@ class OrientationPlot(PlotCanvas):
                        labelcolor=COLORS['text'])
         self.ax.set_ylabel('Degrees (°)', color=COLORS['text'], fontsize=9)
         self.ax.set_ylim(-180, 180)
-    
+
+        self._register_animated(self.roll_line, self.pitch_line, self.yaw_line)
+
     def update_data(self, timestamp, roll, pitch, yaw):
-        self.time_data.append(timestamp / 1000.0)
-        self.roll_data.append(roll)
-        self.pitch_data.append(pitch)
-        self.yaw_data.append(yaw)
-    
+        j = self._i
+        k = j + MAX_BUFFER_SIZE
+        self._t[j] = self._t[k] = timestamp / 1000.0
+        self._roll[j] = self._roll[k] = roll
+        self._pitch[j] = self._pitch[k] = pitch
+        self._yaw[j] = self._yaw[k] = yaw
+        self._i = (j + 1) % MAX_BUFFER_SIZE
+        if self._n < MAX_BUFFER_SIZE:
+            self._n += 1
+
     def refresh_plot(self):
-        if len(self.time_data) < 2:
+        if self._n < 2:
             return
-        
-        data_len = len(self.time_data)
-        step = max(1, data_len // 300)
-        
-        times = list(self.time_data)[::step]
-        rolls = list(self.roll_data)[::step]
-        pitches = list(self.pitch_data)[::step]
-        yaws = list(self.yaw_data)[::step]
-        
-        self.roll_line.set_data(times, rolls)
-        self.pitch_line.set_data(times, pitches)
-        self.yaw_line.set_data(times, yaws)
-        
-        if times:
-            x_max = times[-1]
-            x_min = max(0, x_max - 10)
-            self.ax.set_xlim(x_min, x_max)
-        
-        self.draw_idle()
+
+        # Envelope decimation down to screen-pixel resolution
+        target_px = max(64, self.width())
+        times = self._view(self._t)
+
+        self.roll_line.set_data(
+            *_decimate(times, self._view(self._roll), target_px))
+        self.pitch_line.set_data(
+            *_decimate(times, self._view(self._pitch), target_px))
+        self.yaw_line.set_data(
+            *_decimate(times, self._view(self._yaw), target_px))
+
+        x_max = float(times[-1])
+        x_min = max(0.0, x_max - 10)
+        if self._set_limits((x_min, x_max)):
+            self.draw_idle()  # full pass re-caches the blit background
+        else:
+            self._blit_animated()
 
 
 class MainWindow(QMainWindow):
@@ -685,7 +802,7 @@ class MainWindow(QMainWindow):
             return
         
         self.serial_thread = SerialReaderThread(port)
-        self.serial_thread.frame_received.connect(self.on_frame_received)
+        self.serial_thread.frames_received.connect(self.on_frames_received)
         self.serial_thread.raw_data.connect(self.on_raw_data)
         self.serial_thread.connection_status.connect(self.on_connection_status)
         self.serial_thread.start()
@@ -728,24 +845,26 @@ class MainWindow(QMainWindow):
         except:
             pass
     
-    def on_frame_received(self, frame: TelemetryFrame):
-        """Handle received telemetry frame"""
-        self.frame_count += 1
-        
-        # Update servo plots
-        servo_cmds = [frame.s1_cmd, frame.s2_cmd, frame.s3_cmd, frame.s4_cmd]
-        servo_fbs = [frame.s1_fb, frame.s2_fb, frame.s3_fb, frame.s4_fb]
-        
-        for i, plot in enumerate(self.servo_plots):
-            is_online = (frame.servo_online >> i) & 1
-            plot.update_data(frame.timestamp, servo_cmds[i], servo_fbs[i], is_online)
-        
-        # Update orientation plot
-        self.orientation_plot.update_data(
-            frame.timestamp, frame.roll, frame.pitch, frame.yaw
-        )
-        
-        # Update info labels
+    def on_frames_received(self, frames: list):
+        """Handle a batch of telemetry frames from one serial read"""
+        self.frame_count += len(frames)
+
+        for frame in frames:
+            # Update servo plots
+            servo_cmds = [frame.s1_cmd, frame.s2_cmd, frame.s3_cmd, frame.s4_cmd]
+            servo_fbs = [frame.s1_fb, frame.s2_fb, frame.s3_fb, frame.s4_fb]
+
+            for i, plot in enumerate(self.servo_plots):
+                is_online = (frame.servo_online >> i) & 1
+                plot.update_data(frame.timestamp, servo_cmds[i], servo_fbs[i], is_online)
+
+            # Update orientation plot
+            self.orientation_plot.update_data(
+                frame.timestamp, frame.roll, frame.pitch, frame.yaw
+            )
+
+        # Update info labels from the latest state only
+        frame = frames[-1]
         fix_str = ["No Fix", "2D", "3D"][min(frame.gps_fix, 2)]
         self.gps_label.setText(
             f"📍 GPS: {frame.latitude:.6f}°, {frame.longitude:.6f}° ({frame.satellites} sats, {fix_str})"